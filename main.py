@@ -8,12 +8,13 @@ import sys
 import os
 import logging
 import signal
+import threading
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QThread, QThreadPool, QRunnable, pyqtSignal, Qt
 
 from src.sip_engine import SIPEngine
 from src.audio_router import AudioRouter
-from src.gui.main_window import MainWindow
+from src.gui.main_window import MainWindow, configure_qt_attributes
 
 # Setup logging
 # Create logs directory first
@@ -30,6 +31,37 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# How long shutdown waits for in-flight hangups (each restarts a baresip process)
+_HANGUP_SHUTDOWN_WAIT_MS = 10000
+
+
+class RouteAudioTask(QRunnable):
+    """Apply one audio routing change on the routing worker thread"""
+    
+    def __init__(self, audio_router, line_id: int, channel: int):
+        super().__init__()
+        self.audio_router = audio_router
+        self.line_id = line_id
+        self.channel = channel
+    
+    def run(self):
+        try:
+            self.audio_router.update_routing(self.line_id, self.channel)
+        except Exception as e:
+            logger.error(f"Exception in RouteAudioTask: {e}", exc_info=True)
+
+
+class HangupTask(QRunnable):
+    """Hang up one line on the hangup worker pool"""
+    
+    def __init__(self, app, line_id: int):
+        super().__init__()
+        self.app = app
+        self.line_id = line_id
+    
+    def run(self):
+        self.app._hangup_worker(self.line_id)
+
 
 class PhoneSystemApp:
     """
@@ -43,6 +75,7 @@ class PhoneSystemApp:
         logger.info("="*60)
         
         # Initialize Qt application
+        configure_qt_attributes()
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("Phone System")
         
@@ -55,6 +88,19 @@ class PhoneSystemApp:
         self.audio_router = None
         self.main_window = None
         
+        # Routing changes run on one worker thread so they apply in order without
+        # waiting on the audio router's lock from the GUI thread
+        self._route_pool = QThreadPool()
+        self._route_pool.setMaxThreadCount(1)
+        
+        # Hangups restart the line's baresip process, which blocks for seconds - they
+        # run on their own pool so shutdown can wait for them before stopping the engine
+        self._hangup_pool = QThreadPool()
+        
+        # Lines with a hangup running on a worker thread (baresip restart blocks for seconds)
+        self._hangups_in_progress = set()
+        self._hangup_lock = threading.Lock()
+        
         # Setup signal handlers for clean shutdown using Qt's approach
         # This is async-signal-safe - just sets a flag that Qt event loop checks
         signal.signal(signal.SIGINT, lambda sig, frame: self.app.quit())
@@ -108,10 +154,10 @@ class PhoneSystemApp:
             logger.info("Creating main window...")
             self.main_window = MainWindow(self.sip_engine, self.audio_router)
             
-            # Connect signals
-            self.main_window.make_call_signal.connect(self._on_make_call)
-            self.main_window.hangup_signal.connect(self._on_hangup)
-            self.main_window.route_audio_signal.connect(self._on_route_audio)
+            # Connect signals - queued so the emitting GUI handler returns before the work runs
+            self.main_window.make_call_signal.connect(self._on_make_call, Qt.QueuedConnection)
+            self.main_window.hangup_signal.connect(self._on_hangup, Qt.QueuedConnection)
+            self.main_window.route_audio_signal.connect(self._on_route_audio, Qt.QueuedConnection)
             
             logger.info("System initialization complete")
             return True
@@ -148,6 +194,15 @@ class PhoneSystemApp:
             line_id: Line number (1-8)
             phone_number: Destination number
         """
+        # The line reads IDLE while its hangup restarts baresip - dialing then fails
+        with self._hangup_lock:
+            hanging_up = line_id in self._hangups_in_progress
+        if hanging_up:
+            logger.warning(f"Line {line_id} is still hanging up - not dialing {phone_number}")
+            self._show_warning("Line Busy",
+                             f"Line {line_id} is still hanging up. Try again in a moment.")
+            return
+        
         try:
             logger.info(f"Making call on line {line_id} to {phone_number}")
             
@@ -168,11 +223,27 @@ class PhoneSystemApp:
         Args:
             line_id: Line number (1-8)
         """
+        # Hangup restarts the line's baresip process, which can block for a few
+        # seconds - run it off the GUI thread. State changes reach the window
+        # through the SIP engine's state-change hook.
+        with self._hangup_lock:
+            if line_id in self._hangups_in_progress:
+                logger.info(f"Hangup already in progress on line {line_id}")
+                return
+            self._hangups_in_progress.add(line_id)
+        
+        self._hangup_pool.start(HangupTask(self, line_id))
+    
+    def _hangup_worker(self, line_id: int):
+        """Hang up a line on a worker thread"""
         try:
             logger.info(f"Hanging up line {line_id}")
             self.sip_engine.hangup_call(line_id)
         except Exception as e:
             logger.error(f"Exception in _on_hangup: {e}", exc_info=True)
+        finally:
+            with self._hangup_lock:
+                self._hangups_in_progress.discard(line_id)
     
     def _on_route_audio(self, line_id: int, channel: int):
         """
@@ -188,7 +259,7 @@ class PhoneSystemApp:
                 return
             
             logger.info(f"Routing line {line_id} audio to Output {channel}")
-            self.audio_router.update_routing(line_id, channel)
+            self._route_pool.start(RouteAudioTask(self.audio_router, line_id, channel))
         except Exception as e:
             logger.error(f"Exception in _on_route_audio: {e}", exc_info=True)
     
@@ -232,11 +303,17 @@ class PhoneSystemApp:
         """Shutdown all components"""
         logger.info("Shutting down...")
         
+        # A hangup still restarting baresip would race stop() on the same process
+        if not self._hangup_pool.waitForDone(_HANGUP_SHUTDOWN_WAIT_MS):
+            logger.warning("Hangups still running at shutdown")
+        
         if self.sip_engine:
             logger.info("Stopping SIP engine...")
             self.sip_engine.stop()
         
         if self.audio_router:
+            # Let queued routing changes finish before the router goes away
+            self._route_pool.waitForDone(1000)
             logger.info("Stopping audio router...")
             self.audio_router.stop()
         
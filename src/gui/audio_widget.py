@@ -9,8 +9,13 @@ from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QEvent
 from PyQt5.QtGui import QFont, QMouseEvent
 import logging
 
+from .fonts import ui_font
+
 logger = logging.getLogger(__name__)
 
+# Label colour for each output channel (index 0 = Output 1)
+_OUTPUT_COLORS = ('#4af', '#fa4', '#4f4', '#f4f', '#ff4', '#4ff', '#f44', '#44f')
+
 
 class ToneWorker(QThread):
     """Worker thread for audio operations to prevent GUI blocking"""
@@ -117,14 +122,14 @@ class AudioWidget(QWidget):
         
         # Title
         channels_title = QLabel("📊 Outputs")
-        channels_title.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        channels_title.setFont(ui_font(9))
         channels_title.setAlignment(Qt.AlignCenter)
         channels_title.setStyleSheet("color: #00d4ff; padding: 2px;")
         channels_layout.addWidget(channels_title)
         
         # Show available lines in a nice box
         self.available_label = QLabel("Unassigned: checking...")
-        self.available_label.setFont(QFont("Segoe UI", 8, QFont.Bold))
+        self.available_label.setFont(ui_font(8))
         self.available_label.setAlignment(Qt.AlignCenter)
         self.available_label.setStyleSheet("""
             QLabel {
@@ -150,13 +155,12 @@ class AudioWidget(QWidget):
         
         # Show outputs 1-8 in a 2-column grid - more compact
         self.output_labels = []
-        colors = ['#4af', '#fa4', '#4f4', '#f4f', '#ff4', '#4ff', '#f44', '#44f']
-        for i in range(1, 9):
+        for i, color in enumerate(_OUTPUT_COLORS, start=1):
             output_label = QLabel(f"{i}→-")
-            output_label.setFont(QFont("Segoe UI", 8))
+            output_label.setFont(ui_font(8, bold=False))
             output_label.setStyleSheet(f"""
                 QLabel {{
-                    color: {colors[i-1]};
+                    color: {color};
                     background: rgba(255, 255, 255, 0.05);
                     border: 1px solid rgba(255, 255, 255, 0.1);
                     border-radius: 3px;
@@ -191,7 +195,7 @@ class AudioWidget(QWidget):
         test_layout.setSpacing(5)
         
         test_title = QLabel("🎵 Test Output")
-        test_title.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        test_title.setFont(ui_font(9))
         test_title.setAlignment(Qt.AlignCenter)
         test_title.setStyleSheet("color: #00d4ff; padding: 2px;")
         test_layout.addWidget(test_title)
@@ -201,14 +205,14 @@ class AudioWidget(QWidget):
         selector_layout.setSpacing(8)
         
         selector_label = QLabel("Channel:")
-        selector_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        selector_label.setFont(ui_font(10))
         selector_label.setStyleSheet("color: white;")
         selector_layout.addWidget(selector_label)
         
         self.channel_spinbox = QSpinBox()
         self.channel_spinbox.setRange(1, 8)
         self.channel_spinbox.setValue(1)
-        self.channel_spinbox.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.channel_spinbox.setFont(ui_font(16))
         self.channel_spinbox.setMinimumHeight(50)
         self.channel_spinbox.setMinimumWidth(120)
         self.channel_spinbox.setButtonSymbols(QSpinBox.PlusMinus)  # Use +/- buttons instead of arrows
@@ -242,7 +246,7 @@ class AudioWidget(QWidget):
         # Test button - Simple toggle for touchscreen reliability
         self.test_btn = QPushButton("🔊 Start Test")
         self.test_btn.setCheckable(True)  # Make it a toggle button
-        self.test_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.test_btn.setFont(ui_font(10))
         self.test_btn.setMinimumHeight(36)
         self._tone_playing = False
         
@@ -394,8 +398,11 @@ class AudioWidget(QWidget):
         """
         Update the routing display with current line assignments - with caching
         
+        Like LineWidget.update_display(), this only schedules repaints and
+        must not call repaint() directly.
+        
         Args:
-            lines: List of PhoneLine objects (lines 1-8)
+            lines: Sequence of PhoneLine objects (lines 1-8) - only read, never stored
         """
         # Build mapping of output -> line
         output_to_line = {}
@@ -422,14 +429,13 @@ class AudioWidget(QWidget):
             self.available_label.setText("✅ All lines assigned to outputs")
         
         # Update output labels
-        colors = ['#4af', '#fa4', '#4f4', '#f4f', '#ff4', '#4ff', '#f44', '#44f']
-        for i in range(1, 9):
-            if i in output_to_line:
-                line_id = output_to_line[i]
-                self.output_labels[i-1].setText(f"Out {i} → L{line_id}")
-                self.output_labels[i-1].setStyleSheet(f"""
+        for i, (label, color) in enumerate(zip(self.output_labels, _OUTPUT_COLORS), start=1):
+            line_id = output_to_line.get(i)
+            if line_id is not None:
+                label.setText(f"Out {i} → L{line_id}")
+                label.setStyleSheet(f"""
                     QLabel {{
-                        color: {colors[i-1]};
+                        color: {color};
                         background: qlineargradient(
                             x1:0, y1:0, x2:1, y2:0,
                             stop:0 rgba(46, 213, 115, 0.3),
@@ -442,10 +448,10 @@ class AudioWidget(QWidget):
                     }}
                 """)
             else:
-                self.output_labels[i-1].setText(f"Out {i} → (none)")
-                self.output_labels[i-1].setStyleSheet(f"""
+                label.setText(f"Out {i} → (none)")
+                label.setStyleSheet(f"""
                     QLabel {{
-                        color: {colors[i-1]};
+                        color: {color};
                         background: rgba(255, 255, 255, 0.05);
                         border: 1px solid rgba(255, 255, 255, 0.1);
                         border-radius: 4px;
@@ -6,11 +6,12 @@ Dialer Widget - Touchscreen Number Pad
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QPushButton, QLineEdit, QLabel, QMenu)
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
 import logging
 import json
 import os
 
+from .fonts import ui_font
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +46,7 @@ class DialerWidget(QWidget):
         self.number_display = QLineEdit()
         self.number_display.setReadOnly(True)
         self.number_display.setAlignment(Qt.AlignRight)
-        self.number_display.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        self.number_display.setFont(ui_font(16))
         self.number_display.setMinimumHeight(40)
         self.number_display.setStyleSheet("""
             QLineEdit {
@@ -88,7 +89,7 @@ class DialerWidget(QWidget):
         # Backspace button
         self.backspace_btn = QPushButton("Del")
         self.backspace_btn.setMinimumHeight(40)
-        self.backspace_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.backspace_btn.setFont(ui_font(14))
         self.backspace_btn.setStyleSheet("""
             QPushButton {
                 background: qlineargradient(
@@ -118,7 +119,7 @@ class DialerWidget(QWidget):
         # Clear button
         self.clear_btn = QPushButton("Clr")
         self.clear_btn.setMinimumHeight(40)
-        self.clear_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.clear_btn.setFont(ui_font(14))
         self.clear_btn.setStyleSheet("""
             QPushButton {
                 background: qlineargradient(
@@ -148,7 +149,7 @@ class DialerWidget(QWidget):
         # Recents button
         self.recents_btn = QPushButton("📋")
         self.recents_btn.setMinimumHeight(40)
-        self.recents_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.recents_btn.setFont(ui_font(14))
         self.recents_btn.setStyleSheet("""
             QPushButton {
                 background: qlineargradient(
@@ -185,7 +186,7 @@ class DialerWidget(QWidget):
         # Call button (large, prominent with glow effect) - more compact
         self.call_btn = QPushButton("📞 CALL")
         self.call_btn.setMinimumHeight(50)
-        self.call_btn.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.call_btn.setFont(ui_font(14))
         self.call_btn.setStyleSheet("""
             QPushButton {
                 background: qlineargradient(
@@ -223,7 +224,7 @@ class DialerWidget(QWidget):
         """Create a modern number pad button - compact for small screens"""
         btn = QPushButton(text)
         btn.setMinimumHeight(40)
-        btn.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        btn.setFont(ui_font(16))
         btn.setStyleSheet("""
             QPushButton {
                 background: qlineargradient(
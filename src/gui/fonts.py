@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Shared Fonts - one QFont instance per style, reused by every widget
+"""
+
+from functools import lru_cache
+from PyQt5.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, bold: bool = True) -> QFont:
+    """
+    Return a shared Segoe UI font (built on first use, needs a QApplication)
+    
+    Args:
+        size: Point size
+        bold: Bold weight (default) or normal weight
+    """
+    return QFont("Segoe UI", size, QFont.Bold if bold else QFont.Normal)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Input Focus - active-field highlight and on-screen keyboard handling shared by
+the SIP and network settings dialogs
+"""
+
+
+def set_input_active(field, active):
+    """Toggle the active-field highlight by re-polishing against the dialog sheet"""
+    field.setProperty("active", active)
+    field.style().unpolish(field)
+    field.style().polish(field)
+
+
+def track_input_focus(old, new, input_fields, keyboard):
+    """
+    Apply a focusChanged(old, new) to a dialog's keyboard fields
+    
+    Moves the active highlight, shows the keyboard when a field gains focus and
+    hides it once focus leaves the fields.
+    
+    Returns:
+        new if it is one of input_fields (the new active field), else None
+    """
+    # Keys are NoFocus, so typing never moves focus; moving between fields
+    # arrives here as a single change straight to the next field
+    if old in input_fields:
+        set_input_active(old, False)
+    if new in input_fields:
+        set_input_active(new, True)
+        keyboard.show()
+        return new
+    if keyboard.isVisible():
+        keyboard.hide()
+    return None
@@ -6,14 +6,198 @@ Line Widget - Individual Phone Line Status Display
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QFrame, QComboBox, QMessageBox, QDialog)
 from PyQt5.QtCore import Qt, pyqtSignal, QPoint
-from PyQt5.QtGui import QFont
 import logging
 
 from ..phone_line import PhoneLine, LineState, AudioOutput
 from .dialer_widget import DialerWidget
+from .fonts import ui_font
 
 logger = logging.getLogger(__name__)
 
+# DIAL / HANG UP action button - one sheet, variant picked by the "active" property
+_ACTION_BTN_QSS = """
+    QPushButton {
+        color: white;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton[active="false"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #2ed573, stop:1 #26de81);
+        border: 2px solid #20bf6b;
+    }
+    QPushButton[active="false"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #26de81, stop:1 #20bf6b);
+    }
+    QPushButton[active="false"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #20bf6b, stop:1 #0abf53);
+    }
+    QPushButton[active="true"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #ff6b6b, stop:1 #ee5a52);
+        border: 2px solid #c92a2a;
+    }
+    QPushButton[active="true"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #fa5252, stop:1 #e03131);
+    }
+    QPushButton[active="true"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                    stop:0 #c92a2a, stop:1 #a61e1e);
+    }
+"""
+
+
+# Hangup confirmation box - large, like the dial popup (comfortable for touchscreen)
+_HANGUP_MSG_QSS = """
+    QMessageBox {
+        background-color: #2a2a2a;
+        color: white;
+        font-size: 32px;
+        min-width: 900px;
+        min-height: 600px;
+    }
+    QMessageBox QLabel {
+        color: white;
+        font-size: 36px;
+        font-weight: bold;
+        min-width: 800px;
+        min-height: 250px;
+        padding: 50px;
+        line-height: 1.8;
+    }
+    QMessageBox QDialogButtonBox {
+        spacing: 50px;
+    }
+    QPushButton {
+        background-color: #4a4a4a;
+        color: white;
+        border: 3px solid #666;
+        border-radius: 12px;
+        padding: 30px 60px;
+        font-size: 28px;
+        font-weight: bold;
+        min-width: 250px;
+        min-height: 90px;
+        margin-left: 40px;
+        margin-right: 40px;
+        margin-top: 20px;
+        margin-bottom: 20px;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+        border-color: #888;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+# Channel picker entries - row N routes to output N (row 0 = no output, with down arrow)
+_CHANNEL_PICKER_ITEMS = ["🔇 None ▼"] + [f"🔊 {i}" for i in range(1, 9)]
+
+
+def _build_frame_qss(gradient: str) -> str:
+    """Line frame sheet around one state gradient"""
+    return f"""
+            QFrame {{
+                {gradient}
+                border-radius: 10px;
+            }}
+            QFrame:hover {{
+                border: 2px solid rgba(0, 212, 255, 0.6);
+            }}
+        """
+
+
+# Line frame sheet per display variant - built once, shared by all line widgets
+_FRAME_QSS = {
+    'selected': _build_frame_qss("""
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(0, 212, 255, 0.3),
+                    stop:1 rgba(0, 212, 255, 0.15)
+                );
+                border: 3px solid #00d4ff;
+                box-shadow: 0 0 20px rgba(0, 212, 255, 0.5);
+            """),
+    'idle': _build_frame_qss("""
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(255, 255, 255, 0.08),
+                    stop:1 rgba(255, 255, 255, 0.04)
+                );
+                border: 2px solid rgba(255, 255, 255, 0.15);
+            """),
+    'connected': _build_frame_qss("""
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(46, 213, 115, 0.3),
+                    stop:1 rgba(46, 213, 115, 0.15)
+                );
+                border: 2px solid #2ed573;
+                box-shadow: 0 0 15px rgba(46, 213, 115, 0.3);
+            """),
+    'calling': _build_frame_qss("""
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(255, 159, 26, 0.3),
+                    stop:1 rgba(255, 159, 26, 0.15)
+                );
+                border: 2px solid #ff9f1a;
+                box-shadow: 0 0 15px rgba(255, 159, 26, 0.3);
+            """),
+    'error': _build_frame_qss("""
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(255, 107, 107, 0.3),
+                    stop:1 rgba(255, 107, 107, 0.15)
+                );
+                border: 2px solid #ff6b6b;
+            """),
+}
+
+
+def _build_audio_label_qss(color: str) -> str:
+    """Audio label sheet tinted with one output color"""
+    return f"""
+                QLabel {{
+                    color: {color};
+                    background: rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.25);
+                    padding: 5px 10px;
+                    border-radius: 5px;
+                    font-weight: bold;
+                    min-width: 85px;
+                    max-width: 100px;
+                }}
+            """
+
+
+# Audio label sheet per output channel (index 0 = no output)
+_AUDIO_LABEL_QSS = ("""
+                QLabel {
+                    color: #999;
+                    background: rgba(136, 136, 136, 0.15);
+                    padding: 5px 10px;
+                    border-radius: 5px;
+                    min-width: 85px;
+                    max-width: 100px;
+                }
+            """,) + tuple(_build_audio_label_qss(color) for color in (
+    '#00d4ff',  # Cyan
+    '#ff9f1a',  # Orange
+    '#2ed573',  # Green
+    '#ff6b6b',  # Red
+    '#ffd93d',  # Yellow
+    '#a29bfe',  # Purple
+    '#fd79a8',  # Pink
+    '#6c5ce7'   # Violet
+))
+
 
 class LineWidget(QWidget):
     """
@@ -44,6 +228,10 @@ class LineWidget(QWidget):
         self._last_channel = None
         self._last_selected = None
         self._last_style_state = None  # Cache for style to avoid expensive updates
+        self._frame_qss = None  # Sheets currently applied to the frame / audio label
+        self._audio_qss = None
+        self._hangup_msg = None  # Hangup confirmation box, built on first hangup
+        self._hangup_yes_btn = None
         
         self._create_ui()
         self.update_display()
@@ -83,7 +271,7 @@ class LineWidget(QWidget):
         
         # Line number label (not clickable anymore - use dropdown instead)
         line_label = QLabel(f"Line {self.line.line_id}")
-        line_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        line_label.setFont(ui_font(14))
         line_label.setStyleSheet("""
             QLabel {
                 color: #ff6b35;
@@ -95,7 +283,7 @@ class LineWidget(QWidget):
         top_row.addStretch()
         
         self.audio_label = QLabel("IFB")
-        self.audio_label.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        self.audio_label.setFont(ui_font(9))
         self.audio_label.setAlignment(Qt.AlignCenter)
         self.audio_label.setStyleSheet("""
             QLabel {
@@ -113,7 +301,7 @@ class LineWidget(QWidget):
         
         # Status label with modern font and more space
         self.status_label = QLabel("Available")
-        self.status_label.setFont(QFont("Segoe UI", 11))
+        self.status_label.setFont(ui_font(11, bold=False))
         self.status_label.setAlignment(Qt.AlignLeft)
         self.status_label.setStyleSheet("""
             QLabel {
@@ -132,9 +320,10 @@ class LineWidget(QWidget):
         self.channel_picker = QComboBox()
         self.channel_picker.setObjectName("channel_picker")  # Use CSS from styles.css
         self.channel_picker.setMinimumHeight(50)
-        self.channel_picker.addItem("🔇 None ▼", 0)  # No output with icon and down arrow
-        for i in range(1, 9):
-            self.channel_picker.addItem(f"🔊 {i}", i)
+        # All 9 entries in one model update (row == channel), then attach the channel numbers
+        self.channel_picker.addItems(_CHANNEL_PICKER_ITEMS)
+        for channel in range(len(_CHANNEL_PICKER_ITEMS)):
+            self.channel_picker.setItemData(channel, channel)
         self.channel_picker.setCurrentIndex(0)  # Default to None (matches phone_line default)
         self.channel_picker.currentIndexChanged.connect(self._on_channel_changed)
         
@@ -149,35 +338,10 @@ class LineWidget(QWidget):
         # Hangup button next to picker with safe spacing
         # Action button - DIAL when idle, HANGUP when active
         self.action_btn = QPushButton("📞 DIAL")
-        self.action_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.action_btn.setFont(ui_font(10))
         self.action_btn.clicked.connect(self._on_action_clicked)
-        self.action_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2ed573,
-                    stop:1 #26de81
-                );
-                color: white;
-                border: 3px solid white;
-                border-radius: 8px;
-                padding: 8px 15px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3ee583,
-                    stop:1 #36ee91
-                );
-                border: 3px solid #00d4ff;
-            }
-            QPushButton:pressed {
-                background: #1ea755;
-                padding: 9px 14px 7px 16px;
-            }
-        """)
+        self.action_btn.setProperty("active", False)
+        self.action_btn.setStyleSheet(_ACTION_BTN_QSS)
         button_row.addWidget(self.action_btn)
         
         frame_layout.addLayout(button_row)
@@ -276,70 +440,33 @@ class LineWidget(QWidget):
         # Show dialog
         dialog.exec_()
     
+    def _get_hangup_dialog(self) -> QMessageBox:
+        """Return the hangup confirmation box, constructing it on first use"""
+        if self._hangup_msg is None:
+            # Create custom message box with better styling
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Question)
+            msg_box.setWindowTitle('Confirm Hangup')
+            msg_box.setText(f'Are you sure you want to hang up Line {self.line.line_id}?')
+            
+            # Add buttons
+            self._hangup_yes_btn = msg_box.addButton('Yes', QMessageBox.YesRole)
+            cancel_btn = msg_box.addButton('Cancel', QMessageBox.RejectRole)
+            msg_box.setDefaultButton(cancel_btn)
+            
+            # Make dialog LARGE like dial popup (comfortable for touchscreen)
+            msg_box.setStyleSheet(_HANGUP_MSG_QSS)
+            msg_box.adjustSize()
+            self._hangup_msg = msg_box
+        return self._hangup_msg
+    
     def _on_hangup(self):
         """Handle hangup button click"""
         logger.info(f"[LineWidget] Hangup button clicked for line {self.line.line_id}")
-        
-        # Create custom message box with better styling
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Question)
-        msg_box.setWindowTitle('Confirm Hangup')
-        msg_box.setText(f'Are you sure you want to hang up Line {self.line.line_id}?')
-        
-        # Add buttons
-        yes_btn = msg_box.addButton('Yes', QMessageBox.YesRole)
-        cancel_btn = msg_box.addButton('Cancel', QMessageBox.RejectRole)
-        msg_box.setDefaultButton(cancel_btn)
-        
-        # Make dialog LARGE like dial popup (comfortable for touchscreen)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #2a2a2a;
-                color: white;
-                font-size: 32px;
-                min-width: 900px;
-                min-height: 600px;
-            }
-            QMessageBox QLabel {
-                color: white;
-                font-size: 36px;
-                font-weight: bold;
-                min-width: 800px;
-                min-height: 250px;
-                padding: 50px;
-                line-height: 1.8;
-            }
-            QMessageBox QDialogButtonBox {
-                spacing: 50px;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                color: white;
-                border: 3px solid #666;
-                border-radius: 12px;
-                padding: 30px 60px;
-                font-size: 28px;
-                font-weight: bold;
-                min-width: 250px;
-                min-height: 90px;
-                margin-left: 40px;
-                margin-right: 40px;
-                margin-top: 20px;
-                margin-bottom: 20px;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-                border-color: #888;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
+        msg_box = self._get_hangup_dialog()
         
         # Center dialog on this line widget
-        msg_box.adjustSize()
-        widget_rect = self.rect()
-        widget_center = self.mapToGlobal(widget_rect.center())
+        widget_center = self.mapToGlobal(self.rect().center())
         dialog_size = msg_box.size()
         dialog_x = widget_center.x() - dialog_size.width() // 2
         dialog_y = widget_center.y() - dialog_size.height() // 2
@@ -348,7 +475,7 @@ class LineWidget(QWidget):
         # Show dialog and check response
         msg_box.exec_()
         
-        if msg_box.clickedButton() == yes_btn:
+        if msg_box.clickedButton() == self._hangup_yes_btn:
             logger.info(f"[LineWidget] User confirmed hangup for line {self.line.line_id}")
             self.hangup_clicked.emit(self.line.line_id)
         else:
@@ -361,6 +488,17 @@ class LineWidget(QWidget):
             if channel != self.line.audio_output.channel:
                 self.audio_channel_changed.emit(self.line.line_id, channel)
     
+    def reset_channel_picker(self):
+        """Point the channel picker back at the line's current channel"""
+        # Signals stay blocked so the sync doesn't re-emit audio_channel_changed
+        index = self.channel_picker.findData(self.line.audio_output.channel)
+        if index >= 0 and index != self.channel_picker.currentIndex():
+            self.channel_picker.blockSignals(True)
+            try:
+                self.channel_picker.setCurrentIndex(index)
+            finally:
+                self.channel_picker.blockSignals(False)
+    
     def set_selected(self, selected: bool):
         """Set selection highlight"""
         self.is_selected = selected
@@ -368,7 +506,12 @@ class LineWidget(QWidget):
         self._update_style()
     
     def update_display(self):
-        """Update display based on line state - with caching to reduce CPU"""
+        """
+        Update display based on line state - with caching to reduce CPU
+        
+        Only schedules repaints (setText/setStyleSheet go through update());
+        never call repaint() here so Qt can merge paint events across lines.
+        """
         current_state = self.line.state
         current_channel = self.line.audio_output.channel
         
@@ -386,52 +529,13 @@ class LineWidget(QWidget):
             self.status_label.setText(self.line.get_status_string())
             # Update action button based on line state
             is_active = self.line.is_active()
-            if is_active:
-                # Show HANGUP button (red/orange)
-                self.action_btn.setText("📞 HANG UP")
-                self.action_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #ff6b6b, stop:1 #ee5a52);
-                        color: white;
-                        border: 2px solid #c92a2a;
-                        border-radius: 8px;
-                        padding: 12px;
-                        font-size: 16px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #fa5252, stop:1 #e03131);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #c92a2a, stop:1 #a61e1e);
-                    }
-                """)
-            else:
-                # Show DIAL button (green)
-                self.action_btn.setText("📞 DIAL")
-                self.action_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #2ed573, stop:1 #26de81);
-                        color: white;
-                        border: 2px solid #20bf6b;
-                        border-radius: 8px;
-                        padding: 12px;
-                        font-size: 16px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #26de81, stop:1 #20bf6b);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                    stop:0 #20bf6b, stop:1 #0abf53);
-                    }
-                """)
+            # Text and the "active" property select the DIAL / HANG UP look;
+            # re-polish only when the variant actually flips
+            self.action_btn.setText("📞 HANG UP" if is_active else "📞 DIAL")
+            if self.action_btn.property("active") != is_active:
+                self.action_btn.setProperty("active", is_active)
+                self.action_btn.style().unpolish(self.action_btn)
+                self.action_btn.style().polish(self.action_btn)
             logger.debug(f"Line {self.line.line_id} update: state={current_state}, is_active={is_active}")
         
         # Audio routing (only if channel changed)
@@ -443,12 +547,7 @@ class LineWidget(QWidget):
             
             # Update channel picker only when channel actually changed
             # This is more efficient than syncing on every update
-            self.channel_picker.blockSignals(True)
-            for i in range(self.channel_picker.count()):
-                if self.channel_picker.itemData(i) == current_channel:
-                    self.channel_picker.setCurrentIndex(i)
-                    break
-            self.channel_picker.blockSignals(False)
+            self.reset_channel_picker()
         
         # Update colors (only if state, channel, or selection changed)
         # Check if style actually needs updating to avoid expensive operations on large screens
@@ -466,96 +565,24 @@ class LineWidget(QWidget):
         """Update widget styling based on state with modern colors"""
         # State-based gradient colors
         if self.is_selected:
-            gradient = """
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(0, 212, 255, 0.3),
-                    stop:1 rgba(0, 212, 255, 0.15)
-                );
-                border: 3px solid #00d4ff;
-                box-shadow: 0 0 20px rgba(0, 212, 255, 0.5);
-            """
+            frame_qss = _FRAME_QSS['selected']
         elif self.line.state == LineState.IDLE:
-            gradient = """
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(255, 255, 255, 0.08),
-                    stop:1 rgba(255, 255, 255, 0.04)
-                );
-                border: 2px solid rgba(255, 255, 255, 0.15);
-            """
+            frame_qss = _FRAME_QSS['idle']
         elif self.line.state == LineState.CONNECTED:
-            gradient = """
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(46, 213, 115, 0.3),
-                    stop:1 rgba(46, 213, 115, 0.15)
-                );
-                border: 2px solid #2ed573;
-                box-shadow: 0 0 15px rgba(46, 213, 115, 0.3);
-            """
+            frame_qss = _FRAME_QSS['connected']
         elif self.line.state in [LineState.DIALING, LineState.RINGING]:
-            gradient = """
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(255, 159, 26, 0.3),
-                    stop:1 rgba(255, 159, 26, 0.15)
-                );
-                border: 2px solid #ff9f1a;
-                box-shadow: 0 0 15px rgba(255, 159, 26, 0.3);
-            """
+            frame_qss = _FRAME_QSS['calling']
         else:  # ERROR or DISCONNECTED
-            gradient = """
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(255, 107, 107, 0.3),
-                    stop:1 rgba(255, 107, 107, 0.15)
-                );
-                border: 2px solid #ff6b6b;
-            """
+            frame_qss = _FRAME_QSS['error']
         
-        self.frame.setStyleSheet(f"""
-            QFrame {{
-                {gradient}
-                border-radius: 10px;
-            }}
-            QFrame:hover {{
-                border: 2px solid rgba(0, 212, 255, 0.6);
-            }}
-        """)
+        # Sheets are shared constants - re-apply (and re-polish the children) only
+        # when the variant actually changes, e.g. not for idle -> idle
+        if frame_qss is not self._frame_qss:
+            self.frame.setStyleSheet(frame_qss)
+            self._frame_qss = frame_qss
         
         # Audio label color - vibrant colors for different outputs
-        if self.line.audio_output.channel == 0:
-            self.audio_label.setStyleSheet("""
-                QLabel {
-                    color: #999;
-                    background: rgba(136, 136, 136, 0.15);
-                    padding: 5px 10px;
-                    border-radius: 5px;
-                    min-width: 85px;
-                    max-width: 100px;
-                }
-            """)
-        else:
-            colors = [
-                '#00d4ff',  # Cyan
-                '#ff9f1a',  # Orange  
-                '#2ed573',  # Green
-                '#ff6b6b',  # Red
-                '#ffd93d',  # Yellow
-                '#a29bfe',  # Purple
-                '#fd79a8',  # Pink
-                '#6c5ce7'   # Violet
-            ]
-            color = colors[(self.line.audio_output.channel - 1) % len(colors)]
-            self.audio_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {color};
-                    background: rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.25);
-                    padding: 5px 10px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                    min-width: 85px;
-                    max-width: 100px;
-                }}
-            """)
+        audio_qss = _AUDIO_LABEL_QSS[self.line.audio_output.channel]
+        if audio_qss is not self._audio_qss:
+            self.audio_label.setStyleSheet(audio_qss)
+            self._audio_qss = audio_qss
@@ -3,485 +3,425 @@
 Main Window - TouchScreen GUI
 """
 
-import sys
-import json
 import os
+import re
 import subprocess
-from pathlib import Path
+import threading
+from functools import lru_cache
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QGridLayout, QPushButton, QLabel, QFrame, QMessageBox, 
-                             QComboBox, QDialog, QLineEdit, QSpinBox, QFormLayout, 
-                             QDialogButtonBox, QScrollArea, QSizePolicy)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QEvent, QCoreApplication, QProcess, QObject
-from PyQt5.QtGui import QFont, QPalette, QColor
+                             QComboBox, QDialog, QLineEdit, QFormLayout, QSizePolicy,
+                             QApplication, QListView)
+from PyQt5.QtCore import Qt, QTimer, QElapsedTimer, pyqtSignal, pyqtSlot, QEvent, QCoreApplication
 import logging
 
-from .dialer_widget import DialerWidget
+from .fonts import ui_font
+from .input_focus import set_input_active, track_input_focus
+from .paths import STYLESHEET_PATH
 from .line_widget import LineWidget
 from .audio_widget import AudioWidget
-from .sip_settings import SIPSettingsDialog
 
 logger = logging.getLogger(__name__)
 
+# Mouse cursor auto-hide: inactivity delay, and minimum interval between
+# hide-timer restarts on mouse movement
+_CURSOR_HIDE_DELAY_MS = 3000
+_CURSOR_RESET_THROTTLE_MS = 250
 
+# Event type checked in the cursor event filter, bound once so the filter skips
+# the enum attribute lookup for every event it sees
+_MOUSE_MOVE = QEvent.MouseMove
+
+# Window for coalescing display refresh requests into a single refresh
+_REFRESH_COALESCE_MS = 33
+
+# Watchdog display refresh - state changes are pushed, this only catches strays
+_WATCHDOG_INTERVAL_MS = 10000
+
+# How long detected network settings are reused before the network dialog re-detects them
+_NETWORK_INFO_TTL_MS = 5000
+
+# Gateway/proto from `ip route show default`, first server from `resolvectl status`
+_ROUTE_RE = re.compile(r'default\s+via\s+(\S+).*?proto\s+(\S+)')
+_DNS_RE = re.compile(r'DNS Servers:[ \t]*(\S+)')
+
+# Static IP fields in the network dialog: (label, dialog attribute, placeholder, default)
+_NETWORK_FIELDS = (
+    ("IP Address:", "ip_input", "e.g., 192.168.1.221", "192.168.1.221"),
+    ("Subnet Mask:", "subnet_input", "e.g., 255.255.255.0", "255.255.255.0"),
+    ("Gateway:", "gateway_input", "e.g., 192.168.1.1", "192.168.1.1"),
+    ("DNS Server:", "dns_input", "e.g., 8.8.8.8", "8.8.8.8"),
+)
+
+# Stylesheets - defined once; the named-widget sheets are combined into _WINDOW_QSS
+
+# Dark panel frames, selected by object name from the window sheet so the
+# rules are parsed once; descendant selectors keep them cascading to the
+# frames inside each panel as a per-panel sheet would
+_PANEL_QSS = """
+    QFrame#line_panel, QFrame#line_panel QFrame,
+    QFrame#control_panel, QFrame#control_panel QFrame {
+        background-color: #2a2a2a;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    QFrame#bottom_panel, QFrame#bottom_panel QFrame {
+        background-color: #2a2a2a;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        padding: 8px;
+    }
+"""
+
+# Gear-icon settings button
+_SETTINGS_GEAR_QSS = """
+    QPushButton#settings_gear {
+        background-color: #1a1a1a;
+        border: 2px solid #404040;
+        border-radius: 4px;
+        color: #ff6b35;
+        font-weight: bold;
+    }
+    QPushButton#settings_gear:hover {
+        background-color: #2a2a2a;
+        border-color: #ff6b35;
+    }
+    QPushButton#settings_gear:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+# Message boxes - applied once with the window stylesheet and matched by object name
+# (#channel_conflict = channel-conflict warning, #styled_message = generic message)
+_MESSAGE_BOX_QSS = """
+    QMessageBox#channel_conflict {
+        background-color: #2a2a2a;
+        color: #ddd;
+    }
+    QMessageBox#channel_conflict QLabel {
+        color: #ddd;
+    }
+    QMessageBox#channel_conflict QPushButton {
+        background-color: #505050;
+        color: white;
+        border: 1px solid #666;
+        border-radius: 3px;
+        padding: 5px 15px;
+        min-width: 60px;
+    }
+    QMessageBox#channel_conflict QPushButton:hover {
+        background-color: #606060;
+    }
+    QMessageBox#channel_conflict QPushButton:pressed {
+        background-color: #404040;
+    }
+    QMessageBox#styled_message {
+        background-color: #2a2a2a;
+        color: white;
+        font-size: 14px;
+    }
+    QMessageBox#styled_message QLabel {
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 300px;
+        max-width: 400px;
+    }
+    QMessageBox#styled_message QPushButton {
+        background-color: #4a4a4a;
+        color: white;
+        border: 2px solid #666;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 80px;
+        min-height: 40px;
+    }
+    QMessageBox#styled_message QPushButton:hover {
+        background-color: #5a5a5a;
+        border-color: #888;
+    }
+    QMessageBox#styled_message QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+"""
+
+# Hold to Test button
+_HOLD_TEST_BTN_QSS = """
+    QPushButton#hold_test_btn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                    stop:0 #00d4ff, stop:1 #0088cc);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px;
+        font-weight: bold;
+    }
+    QPushButton#hold_test_btn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                    stop:0 #00e4ff, stop:1 #0099dd);
+    }
+    QPushButton#hold_test_btn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                    stop:0 #2ed573, stop:1 #26de81);
+    }
+"""
+
+# Settings menu dialog
+_SETTINGS_MENU_QSS = """
+    QDialog#settings_menu {
+        background-color: #1a1a1a;
+        border: 3px solid #ff6b35;
+        border-radius: 12px;
+    }
+    QLabel#settings_title {
+        color: #ff6b35;
+        font-size: 32pt;
+        font-weight: bold;
+    }
+"""
+
+# Settings menu - SIP Configuration button
+_SETTINGS_SIP_BTN_QSS = """
+    QPushButton#settings_sip_btn {
+        background-color: #2a2a2a;
+        color: white;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        font-size: 24pt;
+        font-weight: bold;
+        padding: 20px;
+    }
+    QPushButton#settings_sip_btn:hover {
+        background-color: #3a3a3a;
+        border-color: #ff6b35;
+    }
+    QPushButton#settings_sip_btn:pressed {
+        background-color: #1a1a1a;
+    }
+"""
+
+# Settings menu - Network Configuration button
+_SETTINGS_NETWORK_BTN_QSS = """
+    QPushButton#settings_network_btn {
+        background-color: #2a2a2a;
+        color: white;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        font-size: 24pt;
+        font-weight: bold;
+        padding: 20px;
+    }
+    QPushButton#settings_network_btn:hover {
+        background-color: #3a3a3a;
+        border-color: #00d4ff;
+    }
+    QPushButton#settings_network_btn:pressed {
+        background-color: #1a1a1a;
+    }
+"""
+
+# Settings menu - Close button
+_SETTINGS_CLOSE_BTN_QSS = """
+    QPushButton#settings_close_btn {
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-size: 22pt;
+        font-weight: bold;
+    }
+    QPushButton#settings_close_btn:hover {
+        background-color: #7d8a94;
+    }
+    QPushButton#settings_close_btn:pressed {
+        background-color: #5a6268;
+    }
+"""
+
+# Authorization warning dialog
+_WARNING_DIALOG_QSS = """
+    QDialog#auth_dialog {
+        background-color: #1e1e2e;
+        border: 2px solid #3b82f6;
+        border-radius: 12px;
+    }
+    QLabel#auth_message {
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+    }
+"""
+
+# Authorization warning - Cancel button
+_CANCEL_BTN_QSS = """
+    QPushButton#auth_cancel_btn {
+        background-color: #6b7280;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#auth_cancel_btn:pressed {
+        background-color: #4b5563;
+    }
+"""
+
+# Authorization warning - Ok button
+_OK_BTN_QSS = """
+    QPushButton#auth_ok_btn {
+        background-color: #3b82f6;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#auth_ok_btn:pressed {
+        background-color: #2563eb;
+    }
+"""
+
+# Network settings dialog - one sheet on the dialog styles every widget in it by
+# type or object name (the shared keyboard brings its own sheet); the focused
+# field is marked with active="true"
+_NETWORK_DIALOG_QSS = """
+    QDialog {
+        background-color: #1a1a1a;
+        border: 3px solid #00d4ff;
+        border-radius: 12px;
+    }
+    QLabel#network_title {
+        color: #00d4ff;
+        margin-bottom: 5px;
+    }
+    QLabel#network_ip_info {
+        color: #ffa500;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QLabel#network_hint {
+        color: #ffa500;
+        font-size: 13px;
+        font-weight: bold;
+        padding: 5px 0px;
+    }
+    QLabel#network_section {
+        color: #00d4ff;
+        font-size: 16px;
+        font-weight: bold;
+        margin-bottom: 5px;
+    }
+    QLabel#network_field_label {
+        color: #eaeaea;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QComboBox#network_mode_combo {
+        background-color: #2d3748;
+        color: white;
+        border: 2px solid rgba(0, 212, 255, 0.3);
+        border-radius: 6px;
+        padding: 12px;
+        font-size: 18px;
+        font-weight: bold;
+        min-height: 60px;
+    }
+    QComboBox#network_mode_combo::drop-down {
+        border: none;
+        width: 40px;
+    }
+    QComboBox#network_mode_combo::down-arrow {
+        width: 20px;
+        height: 20px;
+    }
+    QComboBox#network_mode_combo QAbstractItemView {
+        background-color: #2d3748;
+        color: white;
+        selection-background-color: #00d4ff;
+        selection-color: #1a1a2e;
+        border: 2px solid rgba(0, 212, 255, 0.3);
+        font-size: 20px;
+        font-weight: bold;
+        padding: 15px;
+    }
+    QComboBox#network_mode_combo QAbstractItemView::item {
+        min-height: 80px;
+        padding: 15px;
+    }
+    QLineEdit {
+        background-color: #2d3748;
+        color: white;
+        border: 2px solid rgba(0, 212, 255, 0.3);
+        border-radius: 6px;
+        padding: 12px;
+        font-size: 16px;
+        min-height: 45px;
+    }
+    QLineEdit:focus {
+        border: 2px solid rgba(0, 212, 255, 0.6);
+    }
+    QLineEdit[active="true"] {
+        border: 2px solid #00d4ff;
+    }
+    QPushButton#network_save_btn, QPushButton#network_cancel_btn {
+        font-size: 16px;
+        font-weight: bold;
+    }
+"""
+
+
+# Every named-widget sheet above, appended once to the window stylesheet - widgets
+# and dialogs under the window pick their rules up by object name
+_WINDOW_QSS = "".join((
+    _PANEL_QSS,
+    _SETTINGS_GEAR_QSS,
+    _MESSAGE_BOX_QSS,
+    _HOLD_TEST_BTN_QSS,
+    _SETTINGS_MENU_QSS,
+    _SETTINGS_SIP_BTN_QSS,
+    _SETTINGS_NETWORK_BTN_QSS,
+    _SETTINGS_CLOSE_BTN_QSS,
+    _WARNING_DIALOG_QSS,
+    _CANCEL_BTN_QSS,
+    _OK_BTN_QSS,
+))
+
+
+def configure_qt_attributes():
+    """
+    Set application-wide Qt attributes - call before QApplication is created
+    
+    Mouse/touch moves are merged into one event per frame, so the cursor
+    auto-hide filter sees a single move instead of a burst of them.
+    """
+    QCoreApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QCoreApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+
+
+@lru_cache(maxsize=None)
 def load_stylesheet():
-    """Load the main CSS stylesheet"""
-    css_path = Path(__file__).parent.parent.parent / 'config' / 'styles.css'
+    """Load the main CSS stylesheet (read from disk once per process)"""
     try:
-        with open(css_path, 'r') as f:
+        with open(STYLESHEET_PATH, 'r') as f:
             return f.read()
     except Exception as e:
         logger.error(f"Failed to load stylesheet: {e}")
         return ""
 
 
-class VirtualKeyboard(QWidget):
-    """Modern virtual on-screen keyboard matching tvOS design"""
-    
-    key_pressed = pyqtSignal(str)
-    close_requested = pyqtSignal()
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.shift_active = False
-        self.setFixedHeight(310)
-        self._create_ui()
-    
-    def _create_ui(self):
-        """Create tvOS-style keyboard layout using grid"""
-        # Use grid layout for precise positioning
-        grid = QGridLayout(self)
-        grid.setSpacing(8)
-        grid.setContentsMargins(15, 12, 15, 12)
-        
-        # Set widget background
-        self.setStyleSheet("VirtualKeyboard { background-color: #18181b; border-radius: 12px; }")
-        
-        # Key style for regular keys
-        key_style = "QPushButton { background-color: #3f3f46; color: white; border: none; border-radius: 8px; font-size: 20px; } QPushButton:pressed { background-color: #52525b; }"
-        
-        # Keyboard letters - 4 rows of 10 each (stored as uppercase for key reference)
-        rows = [
-            ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
-            ['k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't'],
-            ['u', 'v', 'w', 'x', 'y', 'z', '0', '1', '2', '3'],
-            ['4', '5', '6', '7', '8', '9', '+', '-', '.', '@']
-        ]
-        
-        self.key_buttons = {}
-        
-        # Add character keys to grid
-        for row_idx, row in enumerate(rows):
-            for col_idx, key in enumerate(row):
-                btn = QPushButton(key)
-                btn.setFocusPolicy(Qt.NoFocus)
-                btn.setFixedHeight(48)
-                btn.setStyleSheet(key_style)
-                btn.clicked.connect(lambda checked, k=key: self._on_key_click(k))
-                grid.addWidget(btn, row_idx, col_idx)
-                self.key_buttons[key] = btn
-        
-        # Bottom row (row 4) - abc spans 2 cols, Space spans 4 cols, Delete spans 2 cols, Done spans 2 cols
-        # abc button
-        abc_btn = QPushButton('abc')
-        abc_btn.setFocusPolicy(Qt.NoFocus)
-        abc_btn.setFixedHeight(52)
-        abc_btn.setCheckable(True)
-        abc_btn.setStyleSheet(key_style)
-        abc_btn.clicked.connect(lambda: self._on_key_click('ABC'))
-        grid.addWidget(abc_btn, 4, 0, 1, 2)
-        self.key_buttons['ABC'] = abc_btn
-        
-        # Space button
-        space_btn = QPushButton('Space')
-        space_btn.setFocusPolicy(Qt.NoFocus)
-        space_btn.setFixedHeight(52)
-        space_btn.setStyleSheet(key_style)
-        space_btn.clicked.connect(lambda: self._on_key_click('SPACE'))
-        grid.addWidget(space_btn, 4, 2, 1, 4)
-        
-        # Delete button (orange)
-        delete_btn = QPushButton('Delete')
-        delete_btn.setFocusPolicy(Qt.NoFocus)
-        delete_btn.setFixedHeight(52)
-        delete_btn.setStyleSheet("QPushButton { background-color: #f97316; color: white; border: none; border-radius: 8px; font-size: 18px; font-weight: bold; } QPushButton:pressed { background-color: #ea580c; }")
-        delete_btn.clicked.connect(lambda: self._on_key_click('DEL'))
-        grid.addWidget(delete_btn, 4, 6, 1, 2)
-        
-        # Done button (green)
-        done_btn = QPushButton('Done')
-        done_btn.setFocusPolicy(Qt.NoFocus)
-        done_btn.setFixedHeight(52)
-        done_btn.setStyleSheet("QPushButton { background-color: #22c55e; color: white; border: none; border-radius: 8px; font-size: 18px; font-weight: bold; } QPushButton:pressed { background-color: #16a34a; }")
-        done_btn.clicked.connect(lambda: self._on_key_click('Done'))
-        grid.addWidget(done_btn, 4, 8, 1, 2)
-    
-    def _on_key_click(self, key):
-        """Handle key press"""
-        if key == 'ABC':
-            self.shift_active = self.key_buttons['ABC'].isChecked()
-            self._update_key_labels()
-        elif key == 'SPACE':
-            self.key_pressed.emit(' ')
-        elif key == 'DEL':
-            self.key_pressed.emit('\b')
-        elif key == 'Done':
-            self.key_pressed.emit('\n')
-            self.close_requested.emit()
-        else:
-            char = key.upper() if self.shift_active else key.lower()
-            self.key_pressed.emit(char)
-            if self.shift_active and key.isalpha():
-                self.shift_active = False
-                self.key_buttons['ABC'].setChecked(False)
-                self._update_key_labels()
-    
-    def _update_key_labels(self):
-        """Update key labels based on shift state"""
-        for key, btn in self.key_buttons.items():
-            if len(key) == 1 and key.isalpha():
-                btn.setText(key.upper() if self.shift_active else key.lower())
-        if 'ABC' in self.key_buttons:
-            self.key_buttons['ABC'].setText('ABC' if self.shift_active else 'abc')
-
-
-class SIPSettingsDialog(QDialog):
-    """Dialog for configuring SIP credentials"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("SIP Settings")
-        self.setModal(True)
-        self.setMinimumWidth(800)
-        self.setMinimumHeight(850)  # Increased for keyboard + buttons
-        
-        # Current active input field
-        self.active_input = None
-        
-        # Load current config - use path relative to script location
-        script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.config_path = os.path.join(script_dir, "config", "sip_config.json")
-        self.load_config()
-        
-        # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #1a1a2e,
-                    stop:1 #16213e
-                );
-            }
-            QLabel {
-                color: #eaeaea;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QLineEdit, QSpinBox {
-                background-color: #2d3748;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-                min-height: 35px;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border: 2px solid rgba(0, 212, 255, 0.6);
-            }
-            QPushButton {
-                background-color: #4a5568;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #5a6578;
-                border: 2px solid rgba(0, 212, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: #3d4758;
-            }
-        """)
-        
-        self._create_ui()
-    
-    def load_config(self):
-        """Load current SIP configuration"""
-        try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load SIP config: {e}")
-            self.config = {
-                "sip_server": "sip.example.com",
-                "sip_port": 5060,
-                "transport": "UDP",
-                "username": "",
-                "password": "",
-                "caller_id_name": "Production Phone",
-                "caller_id_number": "",
-            }
-    
-    def _create_ui(self):
-        """Create settings dialog UI"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)
-        layout.setContentsMargins(20, 15, 20, 15)
-        
-        # Title
-        title = QLabel("SIP Trunk Configuration")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title.setStyleSheet("color: #00d4ff; margin-bottom: 5px;")
-        layout.addWidget(title)
-        
-        # Form layout
-        form_layout = QFormLayout()
-        form_layout.setSpacing(8)
-        form_layout.setLabelAlignment(Qt.AlignRight)
-        
-        # Create all input fields and connect focus events
-        self.input_fields = []
-        
-        # SIP Server
-        self.server_input = QLineEdit(self.config.get("sip_server", ""))
-        self.server_input.setPlaceholderText("e.g., sip.vonage.com")
-        self.server_input.installEventFilter(self)
-        self.input_fields.append(self.server_input)
-        form_layout.addRow("SIP Server:", self.server_input)
-        
-        # SIP Port (text input for virtual keyboard)
-        self.port_input = QLineEdit(str(self.config.get("sip_port", 5060)))
-        self.port_input.setPlaceholderText("5060")
-        self.port_input.installEventFilter(self)
-        self.input_fields.append(self.port_input)
-        form_layout.addRow("SIP Port:", self.port_input)
-        
-        # Transport
-        self.transport_input = QComboBox()
-        self.transport_input.addItems(["UDP", "TCP", "TLS"])
-        self.transport_input.setCurrentText(self.config.get("transport", "UDP"))
-        self.transport_input.setStyleSheet("""
-            QComboBox {
-                background-color: #2d3748;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-                min-height: 35px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d3748;
-                color: white;
-                selection-background-color: #00d4ff;
-                selection-color: #1a1a2e;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-            }
-        """)
-        form_layout.addRow("Transport:", self.transport_input)
-        
-        # Username
-        self.username_input = QLineEdit(self.config.get("username", ""))
-        self.username_input.setPlaceholderText("SIP Username")
-        self.username_input.installEventFilter(self)
-        self.input_fields.append(self.username_input)
-        form_layout.addRow("Username:", self.username_input)
-        
-        # Password
-        self.password_input = QLineEdit(self.config.get("password", ""))
-        self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setPlaceholderText("SIP Password")
-        self.password_input.installEventFilter(self)
-        self.input_fields.append(self.password_input)
-        form_layout.addRow("Password:", self.password_input)
-        
-        # Caller ID Name
-        self.callerid_name_input = QLineEdit(self.config.get("caller_id_name", ""))
-        self.callerid_name_input.setPlaceholderText("e.g., Production Phone")
-        self.callerid_name_input.installEventFilter(self)
-        self.input_fields.append(self.callerid_name_input)
-        form_layout.addRow("Caller ID Name:", self.callerid_name_input)
-        
-        # Caller ID Number
-        self.callerid_number_input = QLineEdit(self.config.get("caller_id_number", ""))
-        self.callerid_number_input.setPlaceholderText("e.g., +1234567890")
-        self.callerid_number_input.installEventFilter(self)
-        self.input_fields.append(self.callerid_number_input)
-        form_layout.addRow("Caller ID Number:", self.callerid_number_input)
-        
-        layout.addLayout(form_layout)
-        
-        # Add spacing before info label
-        layout.addSpacing(15)
-        
-        # Info label
-        info = QLabel("Tap a field to show keyboard • Changes require restart")
-        info.setStyleSheet("color: #ffa500; font-size: 11px; font-weight: normal; padding: 5px 0px;")
-        info.setWordWrap(True)
-        info.setFixedHeight(25)
-        layout.addWidget(info)
-        
-        # Add spacing before keyboard
-        layout.addSpacing(10)
-        
-        # Virtual Keyboard
-        self.keyboard = VirtualKeyboard(self)
-        self.keyboard.key_pressed.connect(self._on_keyboard_key)
-        self.keyboard.close_requested.connect(self._hide_keyboard)
-        self.keyboard.hide()  # Hide keyboard initially
-        layout.addWidget(self.keyboard)
-        
-        # Buttons - always visible at bottom
-        button_layout = QHBoxLayout()
-        button_layout.setContentsMargins(0, 5, 0, 0)
-        button_layout.addStretch()
-        
-        self.save_btn = QPushButton("Save Settings")
-        self.save_btn.setFocusPolicy(Qt.NoFocus)  # Prevent stealing focus
-        self.save_btn.setMinimumHeight(40)
-        self.save_btn.clicked.connect(self.save_settings)
-        button_layout.addWidget(self.save_btn)
-        
-        self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.setFocusPolicy(Qt.NoFocus)  # Prevent stealing focus
-        self.cancel_btn.setMinimumHeight(40)
-        self.cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_btn)
-        
-        layout.addLayout(button_layout)
-    
-    def showEvent(self, event):
-        """Handle dialog show - ensure keyboard starts hidden"""
-        super().showEvent(event)
-        # Clear any automatic focus and hide keyboard
-        self.setFocus()  # Move focus to dialog itself
-        self.keyboard.hide()
-        self.active_input = None
-    
-    def _hide_keyboard(self):
-        """Hide the virtual keyboard"""
-        self.keyboard.hide()
-        if self.active_input:
-            self.active_input.clearFocus()
-    
-    def _show_keyboard(self):
-        """Show the virtual keyboard"""
-        self.keyboard.show()
-    
-    def eventFilter(self, obj, event):
-        """Handle focus events to track active input field and show/hide keyboard"""
-        if event.type() == QEvent.FocusIn:
-            if isinstance(obj, QLineEdit):
-                self.active_input = obj
-                # Highlight active field
-                obj.setStyleSheet("""
-                    QLineEdit {
-                        background-color: #2d3748;
-                        color: white;
-                        border: 2px solid #00d4ff;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: 13px;
-                        min-height: 35px;
-                    }
-                """)
-                # Show keyboard when text field is focused
-                self._show_keyboard()
-        elif event.type() == QEvent.FocusOut:
-            if isinstance(obj, QLineEdit):
-                # Reset field style
-                obj.setStyleSheet("""
-                    QLineEdit {
-                        background-color: #2d3748;
-                        color: white;
-                        border: 2px solid rgba(0, 212, 255, 0.3);
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: 13px;
-                        min-height: 35px;
-                    }
-                """)
-                # Hide keyboard when focus leaves text field (with slight delay to allow keyboard clicks)
-                QTimer.singleShot(200, self._check_hide_keyboard)
-        return super().eventFilter(obj, event)
-    
-    def _check_hide_keyboard(self):
-        """Check if keyboard should be hidden (no text field has focus)"""
-        # Check if any input field currently has focus
-        for field in self.input_fields:
-            if field.hasFocus():
-                return  # Don't hide, a field still has focus
-        # No text field has focus, hide keyboard and show buttons
-        self._hide_keyboard()
-    
-    def _on_keyboard_key(self, key):
-        """Handle virtual keyboard key press"""
-        if not self.active_input:
-            # Default to first input field
-            self.active_input = self.server_input
-            self.active_input.setFocus()
-            return
-        
-        # Keep focus on active input
-        if not self.active_input.hasFocus():
-            self.active_input.setFocus()
-        
-        if key == '\b':  # Backspace
-            self.active_input.backspace()
-        elif key == '\n':  # Done - hide keyboard
-            self._hide_keyboard()
-        else:
-            self.active_input.insert(key)
-    
-    def save_settings(self):
-        """Save settings to config file"""
-        try:
-            # Update config
-            self.config["sip_server"] = self.server_input.text()
-            # Convert port text to integer, default to 5060 if invalid
-            try:
-                port = int(self.port_input.text())
-                if port < 1 or port > 65535:
-                    port = 5060
-            except ValueError:
-                port = 5060
-            self.config["sip_port"] = port
-            self.config["transport"] = self.transport_input.currentText()
-            self.config["username"] = self.username_input.text()
-            self.config["password"] = self.password_input.text()
-            self.config["caller_id_name"] = self.callerid_name_input.text()
-            self.config["caller_id_number"] = self.callerid_number_input.text()
-            
-            # Write to file
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            
-            logger.info("SIP settings saved successfully")
-            
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Settings Saved",
-                "SIP settings have been saved.\n\nPlease restart the phone system for changes to take effect."
-            )
-            
-            self.accept()
-            
-        except Exception as e:
-            logger.error(f"Failed to save SIP settings: {e}")
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"Failed to save settings:\n{str(e)}"
-            )
+def _install_popup_view(combo: QComboBox, min_width: int, min_height: int, spacing: int) -> QListView:
+    """Give a combo box a pre-configured list popup with the uniform-item-size fast path"""
+    view = QListView()
+    view.setUniformItemSizes(True)  # Row heights are measured once, not per item
+    view.setSpacing(spacing)
+    view.setMinimumWidth(min_width)
+    view.setMinimumHeight(min_height)
+    combo.setView(view)
+    return view
 
 
 class MainWindow(QMainWindow):
@@ -493,6 +433,8 @@ class MainWindow(QMainWindow):
     make_call_signal = pyqtSignal(int, str)  # line_id, phone_number
     hangup_signal = pyqtSignal(int)  # line_id
     route_audio_signal = pyqtSignal(int, int)  # line_id, output_channel
+    line_state_signal = pyqtSignal(int)  # line_id - emitted from SIP monitor threads
+    network_info_signal = pyqtSignal(tuple)  # _read_network_settings() result - emitted from the detection thread
     
     def __init__(self, sip_engine, audio_router):
         """
@@ -510,67 +452,124 @@ class MainWindow(QMainWindow):
         # Selected line for dialing
         self.selected_line_id = None
         
-        # Cache for line selector state
-        self._last_available_lines = None
-        
-        # Load and apply global stylesheet
+        # Control panel widgets are only built when that panel is in use
+        self.line_selector = None
+        self.audio_widget = None
+        self._control_layout = None
+        
+        # Line snapshot as of the last display refresh
+        self._last_state_key = None
+        
+        # Line IDs currently listed in the line selector (None until first build)
+        self._selector_state = None
+        # Bitmask of available lines (bit i = line i+1) the dropdown was last built from
+        self._selector_mask = None
+        
+        # Message boxes are created lazily and reused
+        self._conflict_msg = None
+        self._info_msg = None
+        # (line_id, new_channel, conflicting_line) awaiting the conflict dialog's answer
+        self._pending_channel_change = None
+        # Settings menu, authorization warning, SIP and network settings dialogs are built on first open and reused
+        self._settings_menu = None
+        self._auth_dialog = None
+        self._sip_settings_dialog = None
+        self._network_dialog = None
+        # Settings menu hidden while the authorization warning is open
+        self._auth_parent = None
+        # Settings menu hidden while the SIP settings dialog is open
+        self._sip_parent = None
+        # Settings menu the network dialog was opened from
+        self._network_parent = None
+        # Last detected network settings and their age; detection runs on a worker thread
+        self._network_info = None
+        self._network_info_age = QElapsedTimer()
+        self._network_detecting = False
+        # Screen geometry and center used to place dialogs, and on-screen positions of
+        # the reused settings menu / authorization dialogs (all reset on resize/move)
+        self._screen_geometry = None
+        self._screen_center = None
+        self._settings_menu_pos = None
+        self._auth_dialog_pos = None
+        
+        # Line IDs and objects are stable for the lifetime of the SIP engine
+        self._line_ids = tuple(range(1, self.sip_engine.num_lines + 1))
+        self._lines = tuple(self.sip_engine.get_line(i) for i in self._line_ids)
+        
+        # Reverse index: output channel -> line_id currently using it
+        self._channel_owner = {}
+        for line in self._lines:
+            if line.audio_output.channel:
+                self._channel_owner[line.audio_output.channel] = line.line_id
+        
+        # Load and apply global stylesheet - the named-widget rules ride along so the
+        # panels, buttons and dialogs parented here need no sheet of their own
         stylesheet = load_stylesheet()
         if stylesheet:
-            self.setStyleSheet(stylesheet)
             logger.info("Loaded global stylesheet from config/styles.css")
+        self.setStyleSheet(stylesheet + _WINDOW_QSS)
         
         # UI Setup
         self.setWindowTitle("Phone System - IFB/PL")
         
-        # Get screen geometry and force window to use full screen size
-        from PyQt5.QtWidgets import QApplication
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.geometry()
-        logger.info(f"Screen detected: {screen_geometry.width()}x{screen_geometry.height()}")
-        self.setGeometry(screen_geometry)
-        
-        # Make window fullscreen and responsive to any screen size
+        # Make window fullscreen and responsive to any screen size - showFullScreen()
+        # claims the whole screen itself, so no setGeometry() pass beforehand
         self.showFullScreen()
-        logger.info(f"Window geometry after showFullScreen: {self.geometry().width()}x{self.geometry().height()}")
-        
-        # NOTE: _apply_theme() removed - using CSS file instead (config/styles.css)
-        
-        # Create UI
-        self._create_ui()
-        
-        # Update timer
+        if logger.isEnabledFor(logging.INFO):
+            screen_geometry = self._get_screen_geometry()
+            logger.info(f"Screen detected: {screen_geometry.width()}x{screen_geometry.height()}")
+            logger.info(f"Window geometry after showFullScreen: {self.geometry().width()}x{self.geometry().height()}")
+        
+        # Create UI - the window is already shown, so hold painting until every
+        # panel and line widget is in place and lay out once
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Display refreshes requested within one frame (~33ms) are coalesced
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(_REFRESH_COALESCE_MS)
+        self._refresh_timer.timeout.connect(self._do_update_display)
+        
+        # Push-based updates: SIP state changes are queued onto the GUI thread
+        self.line_state_signal.connect(self._on_line_state_changed)
+        self.network_info_signal.connect(self._on_network_info)
+        self.sip_engine.on_line_state_change = self._on_sip_state_change
+        
+        # Watchdog in case a change ever arrives without a state transition
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(2000)  # Update every 2 seconds (reduce CPU load)
+        self.update_timer.timeout.connect(self._do_update_display)
+        self.update_timer.start(_WATCHDOG_INTERVAL_MS)
         
         # Mouse cursor auto-hide setup
+        self._qapp = QCoreApplication.instance()
         self.cursor_hide_timer = QTimer()
         self.cursor_hide_timer.timeout.connect(self._hide_cursor)
         self.cursor_hide_timer.setSingleShot(True)
+        self.cursor_hide_timer.setInterval(_CURSOR_HIDE_DELAY_MS)
         self.cursor_visible = True
+        # Time since the hide timer was last restarted (throttles MouseMove handling)
+        self._cursor_reset_clock = QElapsedTimer()
+        self._cursor_reset_clock.start()
         
-        # Install application-wide event filter to catch all mouse movements
-        QCoreApplication.instance().installEventFilter(self)
-        logger.info("Cursor auto-hide enabled with application-wide event filter")
+        if os.environ.get("TOUCHSCREEN_ONLY"):
+            # No mouse attached - hide the cursor for good and skip the event filter
+            QApplication.setOverrideCursor(Qt.BlankCursor)
+            self.cursor_visible = False
+            logger.info("TOUCHSCREEN_ONLY set - cursor hidden, auto-hide filter not installed")
+        else:
+            # Watch mouse movement on top-level windows only (this one, plus each
+            # dialog/popup as it takes focus) rather than every event in the app
+            self.winId()  # Make sure the native window exists
+            self.windowHandle().installEventFilter(self)
+            self._qapp.focusWindowChanged.connect(self._watch_window)
+            logger.info("Cursor auto-hide enabled with top-level window event filters")
         
         logger.info("Main window initialized")
     
-    def _apply_theme(self):
-        """Apply professional broadcast theme"""
-        # Broadcast-style dark theme with orange accents
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QFrame {
-                border-radius: 4px;
-            }
-        """)
-    
     def _create_ui(self):
         """Create main UI layout"""
         central_widget = QWidget()
@@ -594,14 +593,7 @@ class MainWindow(QMainWindow):
     def _create_line_panel(self) -> QWidget:
         """Create panel with 8 line status widgets - Broadcast style"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        panel.setObjectName("line_panel")  # Styled by _PANEL_QSS on the window
         
         layout = QGridLayout(panel)
         layout.setSpacing(8)
@@ -609,12 +601,15 @@ class MainWindow(QMainWindow):
         
         # Create 8 line widgets (2 columns x 4 rows)
         self.line_widgets = []
-        for i in range(8):
-            line = self.sip_engine.get_line(i + 1)
+        # Bind handlers once and share them across all line widgets
+        on_hangup = self._on_hangup_clicked
+        on_make_call = self._on_line_make_call
+        on_audio_channel = self._on_audio_channel_changed
+        for i, line in enumerate(self._lines):
             widget = LineWidget(line, self)
-            widget.hangup_clicked.connect(self._on_hangup_clicked)
-            widget.make_call.connect(self._on_line_make_call)
-            widget.audio_channel_changed.connect(self._on_audio_channel_changed)
+            widget.hangup_clicked.connect(on_hangup)
+            widget.make_call.connect(on_make_call)
+            widget.audio_channel_changed.connect(on_audio_channel)
             
             row = i // 2
             col = i % 2
@@ -622,19 +617,13 @@ class MainWindow(QMainWindow):
             
             self.line_widgets.append(widget)
         
+        self._line_panel = panel
         return panel
     
     def _create_control_panel(self) -> QWidget:
         """Create dialer and audio control panel - Broadcast style"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        panel.setObjectName("control_panel")  # Styled by _PANEL_QSS on the window
         
         layout = QVBoxLayout(panel)
         layout.setSpacing(10)
@@ -647,62 +636,45 @@ class MainWindow(QMainWindow):
         # Line selection dropdown - shows only available lines
         self.line_selector = QComboBox()
         self.line_selector.setObjectName("line_selector")  # Use CSS from styles.css
-        self.line_selector.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        self.line_selector.setFont(ui_font(11))
         self.line_selector.setMinimumHeight(60)
         self.line_selector.setSizeAdjustPolicy(QComboBox.AdjustToContents)
         self.line_selector.currentIndexChanged.connect(self._on_line_selector_changed)
         
-        # Make dropdown list fill entire space - same as test channel
-        self.line_selector.view().setMinimumWidth(600)
-        self.line_selector.view().setMinimumHeight(752)  # Same as test channel
-        self.line_selector.view().setSpacing(28)  # Big spacing between items
-        self.line_selector.view().setUniformItemSizes(True)
+        # Make dropdown list fill entire space - same as test channel (big spacing between items)
+        _install_popup_view(self.line_selector, 600, 752, 28)
         
         top_layout.addWidget(self.line_selector, stretch=1)
         
         # Settings button (gear icon only) - Broadcast style
         self.settings_btn = QPushButton("⚙")
-        self.settings_btn.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.settings_btn.setFont(ui_font(18))
         self.settings_btn.setMinimumSize(50, 50)
         self.settings_btn.setMaximumSize(60, 60)
         self.settings_btn.clicked.connect(self._show_settings)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a1a1a;
-                border: 2px solid #404040;
-                border-radius: 4px;
-                color: #ff6b35;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2a2a2a;
-                border-color: #ff6b35;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
+        self.settings_btn.setObjectName("settings_gear")
         top_layout.addWidget(self.settings_btn)
         
         layout.addLayout(top_layout)
         
-        # Audio routing widget
-        self.audio_widget = AudioWidget(self.audio_router, self)
-        layout.addWidget(self.audio_widget)
+        # Audio routing widget is built on first line selection
+        self._control_layout = layout
         
         return panel
     
+    def _ensure_audio_widget(self) -> AudioWidget:
+        """Return the audio routing widget, constructing it on first use"""
+        if self.audio_widget is None:
+            self.audio_widget = AudioWidget(self.audio_router, self)
+            if self._control_layout is not None:
+                self._control_layout.addWidget(self.audio_widget)
+            self.audio_widget.update_routing_display(self._lines)
+        return self.audio_widget
+    
     def _create_bottom_test_panel(self) -> QWidget:
         """Create compact bottom panel with Hold to Test button, channel selector, and settings"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
+        panel.setObjectName("bottom_panel")  # Styled by _PANEL_QSS on the window
         panel.setMaximumHeight(80)
         
         layout = QHBoxLayout(panel)
@@ -720,75 +692,41 @@ class MainWindow(QMainWindow):
         self.test_channel_combo.setMinimumWidth(150)
         self.test_channel_combo.setMinimumHeight(60)
         self.test_channel_combo.setMaxVisibleItems(8)  # Show all 8 channels at once
-        # Add all 8 channels
-        for i in range(1, 9):
-            self.test_channel_combo.addItem(f"Channel {i}", i)
+        # Add all 8 channels in one model update, then attach the channel numbers
+        self.test_channel_combo.addItems([f"Channel {i}" for i in range(1, 9)])
+        for row in range(8):
+            self.test_channel_combo.setItemData(row, row + 1)
         
         # Force items to fill entire dropdown list height - NO EMPTY SPACE
         # Keep list at good size, items will spread out to fill it
-        self.test_channel_combo.view().setMinimumWidth(500)
-        self.test_channel_combo.view().setMinimumHeight(752)  # Fixed list size
-        self.test_channel_combo.view().setSpacing(28)  # BIGGER spacing to fill ALL the way to bottom
-        self.test_channel_combo.view().setUniformItemSizes(True)
+        _install_popup_view(self.test_channel_combo, 500, 752, 28)  # Fixed list size
         
         layout.addWidget(self.test_channel_combo)
         
         # Hold to Test button
         self.hold_test_btn = QPushButton("🔊 Hold to Test")
-        self.hold_test_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.hold_test_btn.setFont(ui_font(12))
         self.hold_test_btn.setMinimumHeight(50)
         self.hold_test_btn.setMinimumWidth(200)
         self.hold_test_btn.pressed.connect(self._on_hold_test_pressed)
         self.hold_test_btn.released.connect(self._on_hold_test_released)
-        self.hold_test_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #00d4ff, stop:1 #0088cc);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #00e4ff, stop:1 #0099dd);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #2ed573, stop:1 #26de81);
-            }
-        """)
+        self.hold_test_btn.setObjectName("hold_test_btn")
         layout.addWidget(self.hold_test_btn)
         
         layout.addStretch()
         
         # Settings button (moved from top)
         settings_btn = QPushButton("⚙")
-        settings_btn.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        settings_btn.setFont(ui_font(18))
         settings_btn.setMinimumSize(55, 55)
         settings_btn.setMaximumSize(65, 65)
         settings_btn.clicked.connect(self._show_settings)
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a1a1a;
-                border: 2px solid #404040;
-                border-radius: 4px;
-                color: #ff6b35;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2a2a2a;
-                border-color: #ff6b35;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
+        settings_btn.setObjectName("settings_gear")
         layout.addWidget(settings_btn)
         
         return panel
     
+    @pyqtSlot()
     def _on_hold_test_pressed(self):
         """Start test tone when button pressed"""
         if not self.audio_router:
@@ -799,6 +737,7 @@ class MainWindow(QMainWindow):
         logger.info(f"Hold to Test pressed - starting tone on channel {channel}")
         self.audio_router.start_continuous_tone(channel)
     
+    @pyqtSlot()
     def _on_hold_test_released(self):
         """Stop test tone when button released"""
         if not self.audio_router:
@@ -807,442 +746,466 @@ class MainWindow(QMainWindow):
         logger.info("Hold to Test released - stopping tone")
         self.audio_router.stop_continuous_tone()
     
+    @pyqtSlot(int)
     def _on_line_selector_changed(self, index: int):
         """Handle line selection from dropdown"""
+        # Get the line_id from the combo box item data ("Select a line..." has None)
+        line_id = self.line_selector.itemData(index) if index > 0 else None
+        if line_id == self.selected_line_id:
+            return  # Selection unchanged - nothing to do
+        
         if index == 0:
             # "Select a line..." option
             self.selected_line_id = None
             logger.info("Line selection cleared")
-        else:
-            # Get the line_id from the combo box item data
-            line_id = self.line_selector.itemData(index)
-            if line_id:
-                self.selected_line_id = line_id
-                logger.info(f"Line {line_id} selected from dropdown")
+        elif line_id:
+            self.selected_line_id = line_id
+            logger.info("Line %d selected from dropdown", line_id)
+            self._ensure_audio_widget()
     
-    def _update_line_selector(self):
-        """Update the line selector dropdown with available lines - with caching"""
-        # Get current available lines
-        available_lines = []
-        for line_id in range(1, 9):
-            line = self.sip_engine.get_line(line_id)
-            if line and line.is_available():
-                available_lines.append(line_id)
-        
-        # Check if available lines changed
-        if tuple(available_lines) == self._last_available_lines:
-            return  # No change, skip expensive update
-        self._last_available_lines = tuple(available_lines)
-        
-        # Store current selection
-        current_line = self.selected_line_id
+    def _update_line_selector(self, snapshot):
+        """Update the line selector dropdown with available lines - only mutates changed rows"""
+        desired = tuple(line_id for line_id, _state, _channel, available in snapshot if available)
         
-        # Block signals while updating
-        self.line_selector.blockSignals(True)
-        self.line_selector.clear()
+        # Rows 1..N mirror the previous state tuple, so the diff needs no model reads
+        previous = self._selector_state or ()
+        available = set(desired)
         
-        # Add default option
-        self.line_selector.addItem("Select a line to dial...", None)
-        
-        # Add available lines
-        for line_id in available_lines:
-            self.line_selector.addItem(f"Line {line_id} (Available)", line_id)
+        # Store current selection
+        current_line = self.line_selector.currentData()
         
-        # Restore selection if still valid
-        if current_line:
-            for i in range(self.line_selector.count()):
-                if self.line_selector.itemData(i) == current_line:
-                    self.line_selector.setCurrentIndex(i)
-                    break
+        # Keep the selection handler disconnected while updating
+        self.line_selector.currentIndexChanged.disconnect(self._on_line_selector_changed)
+        try:
+            # Add default option on first build
+            if self.line_selector.count() == 0:
+                self.line_selector.addItem("Select a line to dial...", None)
+            
+            # Remove lines that are no longer available (row 0 is the default option)
+            for row in range(len(previous), 0, -1):
+                if previous[row - 1] not in available:
+                    self.line_selector.removeItem(row)
+            
+            # Group newly available lines into runs of consecutive rows
+            listed = available.intersection(previous)
+            runs = []  # (first_row, [line_id, ...])
+            for row, line_id in enumerate(desired, start=1):
+                if line_id in listed:
+                    continue
+                if runs and runs[-1][0] + len(runs[-1][1]) == row:
+                    runs[-1][1].append(line_id)
+                else:
+                    runs.append((row, [line_id]))
+            
+            # Insert each run with a single model update, in ascending row order
+            for first_row, line_ids in runs:
+                self.line_selector.insertItems(first_row, [f"Line {line_id} (Available)" for line_id in line_ids])
+                for offset, line_id in enumerate(line_ids):
+                    self.line_selector.setItemData(first_row + offset, line_id)
+            
+            self._selector_state = desired
+            
+            # Restore selection if still valid
+            if current_line in available:
+                self.line_selector.setCurrentIndex(desired.index(current_line) + 1)
             else:
-                # Line no longer available, reset
-                self.selected_line_id = None
+                if current_line:
+                    # Line no longer available, reset
+                    self.selected_line_id = None
                 self.line_selector.setCurrentIndex(0)
-        else:
-            self.line_selector.setCurrentIndex(0)
-        
-        # Unblock signals
-        self.line_selector.blockSignals(False)
+        finally:
+            self.line_selector.currentIndexChanged.connect(self._on_line_selector_changed)
     
+    @pyqtSlot(int)
     def _on_hangup_clicked(self, line_id: int):
         """Handle hangup button click"""
-        logger.info(f"[MainWindow] Hangup clicked signal received for line {line_id}")
+        logger.info("[MainWindow] Hangup clicked signal received for line %d", line_id)
         self.hangup_signal.emit(line_id)
     
+    @pyqtSlot(int, str)
     def _on_line_make_call(self, line_id: int, phone_number: str):
         """Handle make call from line widget popup dialer"""
-        logger.info(f"[MainWindow] Making call on line {line_id} to {phone_number}")
+        logger.info("[MainWindow] Making call on line %d to %s", line_id, phone_number)
         self.make_call_signal.emit(line_id, phone_number)
     
+    def _set_channel(self, line_id: int, channel: int) -> bool:
+        """Route a line to an output and keep the channel -> line reverse index in sync"""
+        line = self._lines[line_id - 1]
+        old_channel = line.audio_output.channel
+        if not line.set_audio_channel(channel):
+            return False
+        if self._channel_owner.get(old_channel) == line_id:
+            del self._channel_owner[old_channel]
+        if channel:
+            self._channel_owner[channel] = line_id
+        return True
+    
+    @pyqtSlot(int, int)
     def _on_audio_channel_changed(self, line_id: int, new_channel: int):
         """Handle audio channel selection change"""
         # If setting to None (0), no conflict check needed
         if new_channel == 0:
-            line = self.sip_engine.get_line(line_id)
-            line.set_audio_channel(new_channel)
-            logger.info(f"Line {line_id}: Channel set to None")
-            self.route_audio_signal.emit(line_id, new_channel)
-            self._update_display()
+            self._apply_channel(line_id, new_channel)
             return
         
         # Check if another line is already using this channel
-        conflicting_line = None
-        for i in range(1, 9):
-            if i != line_id:
-                line = self.sip_engine.get_line(i)
-                if line.audio_output.channel == new_channel:
-                    conflicting_line = i
-                    break
+        conflicting_line = self._channel_owner.get(new_channel)
+        if conflicting_line == line_id:
+            conflicting_line = None
         
         if conflicting_line:
-            # Show warning dialog
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Warning)
-            msg.setWindowTitle("Channel In Use")
+            # Show warning dialog (built once, only the text changes)
+            msg = self._get_conflict_dialog()
             msg.setText(f"Output Channel {new_channel} is already in use by Line {conflicting_line}.")
             msg.setInformativeText(f"Line {conflicting_line} will be disconnected from this output.\n\nDo you want to proceed?")
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.Cancel)
             msg.setDefaultButton(QMessageBox.Cancel)
             
-            # Style the message box to match dark theme
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #2a2a2a;
-                    color: #ddd;
-                }
-                QMessageBox QLabel {
-                    color: #ddd;
-                }
-                QPushButton {
-                    background-color: #505050;
-                    color: white;
-                    border: 1px solid #666;
-                    border-radius: 3px;
-                    padding: 5px 15px;
-                    min-width: 60px;
-                }
-                QPushButton:hover {
-                    background-color: #606060;
-                }
-                QPushButton:pressed {
-                    background-color: #404040;
-                }
-            """)
-            
             # Center the message box on screen
-            from PyQt5.QtWidgets import QApplication
-            screen_center = QApplication.primaryScreen().geometry().center()
+            screen_center = self._get_screen_center()
             msg.move(screen_center.x() - msg.width() // 2, screen_center.y() - msg.height() // 2)
             
-            result = msg.exec_()
-            
-            if result == QMessageBox.Yes:
-                # User confirmed - disconnect conflicting line from output
-                conflicting_line_obj = self.sip_engine.get_line(conflicting_line)
-                conflicting_line_obj.set_audio_channel(0)  # Set to 0 (no output)
-                logger.info(f"Line {conflicting_line}: Disconnected from Output {new_channel}")
-                
-                # Now assign the new line to this channel
-                line = self.sip_engine.get_line(line_id)
-                line.set_audio_channel(new_channel)
-                logger.info(f"Line {line_id}: Channel changed to {new_channel}")
-                self.route_audio_signal.emit(line_id, new_channel)
-                self._update_display()
-            else:
-                # User cancelled - revert to previous channel
-                logger.info(f"Line {line_id}: Channel change to {new_channel} cancelled")
-                self._update_display()  # This will reset the picker to current channel
+            # Window-modal without a nested event loop - the answer arrives in
+            # _on_conflict_dialog_finished while timers and SIP signals keep running
+            self._pending_channel_change = (line_id, new_channel, conflicting_line)
+            msg.open()
         else:
             # No conflict - proceed with channel change
-            line = self.sip_engine.get_line(line_id)
-            line.set_audio_channel(new_channel)
-            logger.info(f"Line {line_id}: Channel changed to {new_channel}")
-            self.route_audio_signal.emit(line_id, new_channel)
-            self._update_display()
+            self._apply_channel(line_id, new_channel)
+    
+    def _apply_channel(self, line_id: int, channel: int):
+        """Route a line to an output, forward the change to the audio router and refresh"""
+        self._set_channel(line_id, channel)
+        logger.info("Line %d: Channel changed to %d", line_id, channel)
+        self.route_audio_signal.emit(line_id, channel)
+        self._update_display()
+    
+    @pyqtSlot(int)
+    def _on_conflict_dialog_finished(self, result: int):
+        """Apply or cancel the channel change the conflict dialog was opened for"""
+        if self._pending_channel_change is None:
+            return
+        line_id, new_channel, conflicting_line = self._pending_channel_change
+        self._pending_channel_change = None
+        
+        if result == QMessageBox.Yes:
+            # User confirmed - disconnect conflicting line from output
+            self._set_channel(conflicting_line, 0)  # Set to 0 (no output)
+            logger.info("Line %d: Disconnected from Output %d", conflicting_line, new_channel)
+            
+            # Now assign the new line to this channel
+            self._apply_channel(line_id, new_channel)
+        else:
+            # User cancelled - revert to previous channel
+            logger.info("Line %d: Channel change to %d cancelled", line_id, new_channel)
+            # Nothing was routed, so the display refresh would see no change -
+            # point the picker back at the line's channel directly
+            self.line_widgets[line_id - 1].reset_channel_picker()
+    
+    def _on_sip_state_change(self, line_id: int, old_state, new_state):
+        """SIP engine callback - runs on a monitor thread, so only emit a signal"""
+        self.line_state_signal.emit(line_id)
+    
+    @pyqtSlot(int)
+    def _on_line_state_changed(self, line_id: int):
+        """Refresh the display when a line changes state (GUI thread)"""
+        self._update_display()
     
+    @pyqtSlot()
     def _update_display(self):
+        """Schedule a display refresh - bursts of changes collapse into one refresh"""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    @pyqtSlot()
+    def _do_update_display(self):
         """Update all line displays - optimized for large screens"""
         try:
-            # Update widgets - caching in update_display() prevents unnecessary work
-            for widget in self.line_widgets:
-                widget.update_display()
-            
-            # Update audio routing display (has its own caching)
-            lines = [self.sip_engine.get_line(i) for i in range(1, 9)]
-            self.audio_widget.update_routing_display(lines)
+            # Skip the whole refresh when no line changed state or channel
+            snapshot = self.sip_engine.get_lines_snapshot()
+            state_key = tuple(snapshot)
+            previous = self._last_state_key
+            if state_key == previous:
+                return
+            self._last_state_key = state_key
             
-            # Update line selector dropdown (has its own caching)
-            self._update_line_selector()
+            # Suspend painting on every panel touched below so each repaints once
+            # for the whole batch
+            frozen = [self._line_panel]
+            if self.audio_widget is not None:
+                frozen.append(self.audio_widget)
+            for panel in frozen:
+                panel.setUpdatesEnabled(False)
+            try:
+                # Only touch widgets whose line entry changed since the last refresh
+                for i, widget in enumerate(self.line_widgets):
+                    if previous is None or snapshot[i] != previous[i]:
+                        widget.update_display()
+                
+                # Update audio routing display (has its own caching)
+                if self.audio_widget is not None:
+                    self.audio_widget.update_routing_display(self._lines)
+                
+                # Update line selector dropdown only when the set of available lines changed
+                if self.line_selector is not None:
+                    available_mask = 0
+                    for bit, entry in enumerate(snapshot):
+                        if entry[3]:
+                            available_mask |= 1 << bit
+                    if available_mask != self._selector_mask:
+                        self._selector_mask = available_mask
+                        self._update_line_selector(snapshot)
+            finally:
+                for panel in frozen:
+                    panel.setUpdatesEnabled(True)
         except Exception as e:
-            logger.error(f"Error in _update_display: {e}", exc_info=True)
+            logger.error(f"Error in _do_update_display: {e}", exc_info=True)
+    
+    def _get_conflict_dialog(self) -> QMessageBox:
+        """Return the channel-conflict dialog, constructing it on first use"""
+        if self._conflict_msg is None:
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Warning)
+            msg.setWindowTitle("Channel In Use")
+            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.Cancel)
+            msg.setDefaultButton(QMessageBox.Cancel)
+            
+            # Dark theme comes from the window stylesheet (_MESSAGE_BOX_QSS)
+            msg.setObjectName("channel_conflict")
+            msg.finished.connect(self._on_conflict_dialog_finished)
+            self._conflict_msg = msg
+        return self._conflict_msg
+    
+    def _get_info_dialog(self) -> QMessageBox:
+        """Return the styled message dialog, constructing it on first use"""
+        if self._info_msg is None:
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Warning)
+            msg_box.setStandardButtons(QMessageBox.Ok)
+            
+            # Compact, high-visibility style comes from the window stylesheet (_MESSAGE_BOX_QSS)
+            msg_box.setObjectName("styled_message")
+            self._info_msg = msg_box
+        return self._info_msg
+    
+    def _get_screen_geometry(self):
+        """Return the primary screen geometry, cached until the window is resized or moved"""
+        if self._screen_geometry is None:
+            self._screen_geometry = QApplication.primaryScreen().geometry()
+        return self._screen_geometry
+    
+    def _get_screen_center(self):
+        """Return the primary screen center, cached until the window is resized or moved"""
+        if self._screen_center is None:
+            self._screen_center = self._get_screen_geometry().center()
+        return self._screen_center
+    
+    def _invalidate_dialog_positions(self):
+        """Drop cached screen metrics and dialog positions"""
+        self._screen_geometry = None
+        self._screen_center = None
+        self._settings_menu_pos = None
+        self._auth_dialog_pos = None
+    
+    def resizeEvent(self, event):
+        """Invalidate cached dialog positions when the window is resized"""
+        self._invalidate_dialog_positions()
+        super().resizeEvent(event)
+    
+    def moveEvent(self, event):
+        """Invalidate cached dialog positions when the window moves (e.g. to another screen)"""
+        self._invalidate_dialog_positions()
+        super().moveEvent(event)
     
     def _show_styled_message(self, title: str, message: str):
         """Show a styled message dialog"""
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Warning)
+        msg_box = self._get_info_dialog()
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStandardButtons(QMessageBox.Ok)
-        
-        # Style the message box for better visibility - more compact for small screens
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #2a2a2a;
-                color: white;
-                font-size: 14px;
-            }
-            QMessageBox QLabel {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 300px;
-                max-width: 400px;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                color: white;
-                border: 2px solid #666;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 80px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-                border-color: #888;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-        """)
         
         # Center the message box on screen
-        from PyQt5.QtWidgets import QApplication
-        screen_center = QApplication.primaryScreen().geometry().center()
+        screen_center = self._get_screen_center()
         msg_box.adjustSize()  # Ensure size is calculated
         msg_box.move(screen_center.x() - msg_box.width() // 2, screen_center.y() - msg_box.height() // 2)
         
         msg_box.exec_()
     
+    def _get_settings_menu(self) -> QDialog:
+        """Return the settings menu dialog, constructing it on first use"""
+        if self._settings_menu is None:
+            # Create settings menu dialog
+            menu_dialog = QDialog(self)
+            menu_dialog.setWindowTitle("Settings")
+            menu_dialog.setMinimumSize(600, 500)
+            menu_dialog.setObjectName("settings_menu")
+            
+            layout = QVBoxLayout(menu_dialog)
+            layout.setSpacing(20)
+            layout.setContentsMargins(30, 30, 30, 30)
+            
+            # Title
+            title = QLabel("⚙ Settings")
+            title.setObjectName("settings_title")
+            title.setAlignment(Qt.AlignCenter)
+            layout.addWidget(title)
+            
+            layout.addSpacing(20)
+            
+            # SIP Configuration button
+            sip_btn = QPushButton("📞 SIP Configuration")
+            sip_btn.setMinimumHeight(100)
+            sip_btn.setObjectName("settings_sip_btn")
+            sip_btn.clicked.connect(lambda: self._show_sip_settings(menu_dialog))
+            layout.addWidget(sip_btn)
+            
+            # Network Configuration button
+            network_btn = QPushButton("🌐 Network Configuration")
+            network_btn.setMinimumHeight(100)
+            network_btn.setObjectName("settings_network_btn")
+            network_btn.clicked.connect(lambda: self._show_network_settings(menu_dialog))
+            layout.addWidget(network_btn)
+            
+            layout.addStretch()
+            
+            # Close button
+            close_btn = QPushButton("Close")
+            close_btn.setMinimumHeight(80)
+            close_btn.setObjectName("settings_close_btn")
+            close_btn.clicked.connect(menu_dialog.close)
+            layout.addWidget(close_btn)
+            
+            self._settings_menu = menu_dialog
+        return self._settings_menu
+    
+    @pyqtSlot()
     def _show_settings(self):
         """Show settings menu with options"""
-        # Create settings menu dialog
-        menu_dialog = QDialog(self)
-        menu_dialog.setWindowTitle("Settings")
-        menu_dialog.setMinimumSize(600, 500)
-        menu_dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-                border: 3px solid #ff6b35;
-                border-radius: 12px;
-            }
-        """)
-        
-        layout = QVBoxLayout(menu_dialog)
-        layout.setSpacing(20)
-        layout.setContentsMargins(30, 30, 30, 30)
-        
-        # Title
-        title = QLabel("⚙ Settings")
-        title.setStyleSheet("color: #ff6b35; font-size: 32pt; font-weight: bold;")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-        
-        layout.addSpacing(20)
-        
-        # SIP Configuration button
-        sip_btn = QPushButton("📞 SIP Configuration")
-        sip_btn.setMinimumHeight(100)
-        sip_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: white;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                font-size: 24pt;
-                font-weight: bold;
-                padding: 20px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #ff6b35;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
-        sip_btn.clicked.connect(lambda: self._show_sip_settings(menu_dialog))
-        layout.addWidget(sip_btn)
-        
-        # Network Configuration button
-        network_btn = QPushButton("🌐 Network Configuration")
-        network_btn.setMinimumHeight(100)
-        network_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a2a;
-                color: white;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                font-size: 24pt;
-                font-weight: bold;
-                padding: 20px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #00d4ff;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-        """)
-        network_btn.clicked.connect(lambda: self._show_network_settings(menu_dialog))
-        layout.addWidget(network_btn)
-        
-        layout.addStretch()
-        
-        # Close button
-        close_btn = QPushButton("Close")
-        close_btn.setMinimumHeight(80)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 22pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7d8a94;
-            }
-            QPushButton:pressed {
-                background-color: #5a6268;
-            }
-        """)
-        close_btn.clicked.connect(menu_dialog.close)
-        layout.addWidget(close_btn)
-        
-        # Position dialog on right side of screen
-        from PyQt5.QtWidgets import QApplication
-        menu_dialog.adjustSize()
-        screen_geometry = QApplication.primaryScreen().geometry()
-        # Position on right side with some margin from edge
-        x_position = screen_geometry.width() - menu_dialog.width() - 50
-        y_position = (screen_geometry.height() - menu_dialog.height()) // 2
-        menu_dialog.move(x_position, y_position)
-        
-        menu_dialog.exec_()
+        menu_dialog = self._get_settings_menu()
+        
+        # Position dialog on right side of screen (the menu's size never changes)
+        if self._settings_menu_pos is None:
+            menu_dialog.adjustSize()
+            screen_geometry = self._get_screen_geometry()
+            # Position on right side with some margin from edge
+            x_position = screen_geometry.width() - menu_dialog.width() - 50
+            y_position = (screen_geometry.height() - menu_dialog.height()) // 2
+            self._settings_menu_pos = (x_position, y_position)
+        menu_dialog.move(*self._settings_menu_pos)
+        
+        # Window-modal without a nested event loop - the menu's buttons drive the rest
+        menu_dialog.open()
+    
+    def _get_auth_dialog(self) -> QDialog:
+        """Return the authorization warning dialog, constructing it on first use"""
+        if self._auth_dialog is None:
+            # Custom warning dialog
+            warning = QDialog(self)
+            warning.setWindowTitle("Authorization Required")
+            warning.setMinimumSize(350, 200)
+            warning.setMaximumSize(500, 300)
+            warning.setObjectName("auth_dialog")
+            
+            layout = QVBoxLayout(warning)
+            layout.setSpacing(20)
+            layout.setContentsMargins(30, 30, 30, 30)
+            
+            # Warning message
+            label = QLabel("Only authorized users may change this setting.")
+            label.setObjectName("auth_message")
+            label.setAlignment(Qt.AlignCenter)
+            label.setWordWrap(True)
+            layout.addWidget(label)
+            
+            layout.addStretch()
+            
+            # Buttons
+            btn_layout = QHBoxLayout()
+            btn_layout.setSpacing(15)
+            
+            cancel_btn = QPushButton("Cancel")
+            cancel_btn.setMinimumSize(100, 45)
+            cancel_btn.setObjectName("auth_cancel_btn")
+            cancel_btn.clicked.connect(warning.reject)
+            btn_layout.addWidget(cancel_btn)
+            
+            ok_btn = QPushButton("Ok")
+            ok_btn.setMinimumSize(100, 45)
+            ok_btn.setObjectName("auth_ok_btn")
+            ok_btn.clicked.connect(warning.accept)
+            btn_layout.addWidget(ok_btn)
+            
+            layout.addLayout(btn_layout)
+            
+            warning.finished.connect(self._on_auth_dialog_finished)
+            self._auth_dialog = warning
+        return self._auth_dialog
     
     def _show_sip_settings(self, parent_dialog):
         """Show SIP settings dialog with authorization warning"""
         parent_dialog.hide()  # Hide menu temporarily
         
-        # Create custom warning dialog
-        warning = QDialog(self)
-        warning.setWindowTitle("Authorization Required")
-        warning.setMinimumSize(350, 200)
-        warning.setMaximumSize(500, 300)
-        warning.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e2e;
-                border: 2px solid #3b82f6;
-                border-radius: 12px;
-            }
-        """)
-        
-        layout = QVBoxLayout(warning)
-        layout.setSpacing(20)
-        layout.setContentsMargins(30, 30, 30, 30)
-        
-        # Warning message
-        label = QLabel("Only authorized users may change this setting.")
-        label.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        label.setAlignment(Qt.AlignCenter)
-        label.setWordWrap(True)
-        layout.addWidget(label)
-        
-        layout.addStretch()
-        
-        # Buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(15)
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setMinimumSize(100, 45)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6b7280;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #4b5563;
-            }
-        """)
-        cancel_btn.clicked.connect(warning.reject)
-        btn_layout.addWidget(cancel_btn)
-        
-        ok_btn = QPushButton("Ok")
-        ok_btn.setMinimumSize(100, 45)
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:pressed {
-                background-color: #2563eb;
-            }
-        """)
-        ok_btn.clicked.connect(warning.accept)
-        btn_layout.addWidget(ok_btn)
-        
-        layout.addLayout(btn_layout)
+        warning = self._get_auth_dialog()
         
         # Center dialog on screen
-        from PyQt5.QtWidgets import QApplication
-        warning.adjustSize()
-        screen_center = QApplication.primaryScreen().geometry().center()
-        warning.move(screen_center.x() - warning.width() // 2, 
-                    screen_center.y() - warning.height() // 2)
+        if self._auth_dialog_pos is None:
+            warning.adjustSize()
+            screen_center = self._get_screen_center()
+            self._auth_dialog_pos = (screen_center.x() - warning.width() // 2,
+                                     screen_center.y() - warning.height() // 2)
+        warning.move(*self._auth_dialog_pos)
+        
+        # Window-modal without a nested event loop - continues in _on_auth_dialog_finished
+        self._auth_parent = parent_dialog
+        warning.open()
+    
+    @pyqtSlot(int)
+    def _on_auth_dialog_finished(self, result: int):
+        """Open SIP settings once the authorization warning is accepted"""
+        parent_dialog = self._auth_parent
+        self._auth_parent = None
+        if parent_dialog is None:
+            return
         
-        if warning.exec_() != QDialog.Accepted:
+        if result != QDialog.Accepted:
             parent_dialog.show()  # Show menu again
             return
         
         logger.info("Opening SIP settings dialog")
-        dialog = SIPSettingsDialog(self)
-        result = dialog.exec_()
+        if self._sip_settings_dialog is None:
+            # Imported on first use - the dialog and its keyboard are only built when needed
+            from .sip_settings import SIPSettingsDialog
+            self._sip_settings_dialog = SIPSettingsDialog(self)
+            self._sip_settings_dialog.finished.connect(self._on_sip_dialog_finished)
+        else:
+            self._sip_settings_dialog.reload()
+        
+        # Opened from this finished slot, so no nested event loop here either -
+        # continues in _on_sip_dialog_finished
+        self._sip_parent = parent_dialog
+        self._sip_settings_dialog.open()
+    
+    @pyqtSlot(int)
+    def _on_sip_dialog_finished(self, result: int):
+        """Bring the settings menu back once the SIP settings dialog closes"""
+        parent_dialog = self._sip_parent
+        self._sip_parent = None
         
         if result == QDialog.Accepted:
             logger.info("SIP settings updated - restart required")
         
-        parent_dialog.show()  # Show menu again
+        if parent_dialog is not None:
+            parent_dialog.show()  # Show menu again
     
-    def _show_network_settings(self, parent_dialog):
-        """Show network configuration dialog"""
-        parent_dialog.hide()  # Hide menu temporarily
+    def _get_network_dialog(self) -> QDialog:
+        """Return the network configuration dialog, constructing it on first use"""
+        if self._network_dialog is not None:
+            return self._network_dialog
         
         # Create network settings dialog - compact, no extra space
         network_dialog = QDialog(self)
         network_dialog.setWindowTitle("Network Configuration")
         network_dialog.setModal(True)
         network_dialog.setMinimumWidth(800)
-        network_dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-                border: 3px solid #00d4ff;
-                border-radius: 12px;
-            }
-        """)
+        network_dialog.setStyleSheet(_NETWORK_DIALOG_QSS)
         
         # Simple layout - compact spacing
         layout = QVBoxLayout(network_dialog)
@@ -1251,56 +1214,20 @@ class MainWindow(QMainWindow):
         
         # Title (same as SIP style)
         title = QLabel("Network Configuration")
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        title.setStyleSheet("color: #00d4ff; margin-bottom: 5px;")
+        title.setFont(ui_font(18))
+        title.setObjectName("network_title")
         layout.addWidget(title)
         
-        # Get current IP info and detect if static or DHCP
-        import subprocess
-        try:
-            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
-            current_ip = result.stdout.strip().split()[0] if result.stdout else "Unknown"
-        except:
-            current_ip = "Unknown"
-        
-        # Detect current network mode (check if route is static)
-        is_static = False
-        current_gateway = ""
-        current_dns = ""
-        try:
-            # Check if route is static
-            route_result = subprocess.run(['ip', 'route', 'show', 'default'], 
-                                         capture_output=True, text=True, timeout=2)
-            if 'proto static' in route_result.stdout:
-                is_static = True
-                # Extract gateway
-                parts = route_result.stdout.split()
-                if 'via' in parts:
-                    idx = parts.index('via')
-                    if idx + 1 < len(parts):
-                        current_gateway = parts[idx + 1]
-            
-            # Get DNS server
-            dns_result = subprocess.run(['resolvectl', 'status', 'eth0'], 
-                                       capture_output=True, text=True, timeout=2)
-            for line in dns_result.stdout.split('\n'):
-                if 'DNS Servers:' in line:
-                    current_dns = line.split(':')[1].strip()
-                    break
-        except:
-            pass
-        
-        # Current IP display (compact info label)
-        mode_text = "Static IP" if is_static else "DHCP"
-        ip_info = QLabel(f"Current: {current_ip} ({mode_text})")
-        ip_info.setStyleSheet("color: #ffa500; font-size: 13px; font-weight: bold;")
+        # Current IP display (compact info label) - text is filled in on every open
+        ip_info = QLabel()
+        ip_info.setObjectName("network_ip_info")
         layout.addWidget(ip_info)
         
         layout.addSpacing(8)
         
         # Network mode selector
         mode_label = QLabel("Mode:")
-        mode_label.setStyleSheet("color: #eaeaea; font-size: 16px; font-weight: bold;")
+        mode_label.setObjectName("network_field_label")
         layout.addWidget(mode_label)
         
         mode_combo = QComboBox()
@@ -1310,52 +1237,9 @@ class MainWindow(QMainWindow):
         mode_combo.setMinimumHeight(60)  # Same as test channel
         mode_combo.setMaxVisibleItems(2)  # Show both options
         
-        # Make dropdown list larger with better spacing (same as test channel)
-        mode_combo.view().setMinimumWidth(700)
-        mode_combo.view().setMinimumHeight(200)  # Tall enough for 2 items
-        mode_combo.view().setSpacing(20)  # Good spacing between items
-        mode_combo.view().setUniformItemSizes(True)
-        
-        mode_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2d3748;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 18px;
-                font-weight: bold;
-                min-height: 60px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 40px;
-            }
-            QComboBox::down-arrow {
-                width: 20px;
-                height: 20px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d3748;
-                color: white;
-                selection-background-color: #00d4ff;
-                selection-color: #1a1a2e;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                font-size: 20px;
-                font-weight: bold;
-                padding: 15px;
-            }
-            QComboBox QAbstractItemView::item {
-                min-height: 80px;
-                padding: 15px;
-            }
-        """)
+        # Make dropdown list larger with better spacing (tall enough for 2 items)
+        _install_popup_view(mode_combo, 700, 200, 20)
         
-        # Set current mode in dropdown
-        if is_static:
-            mode_combo.setCurrentIndex(1)  # Select "Manual (Static IP)"
-        else:
-            mode_combo.setCurrentIndex(0)  # Select "DHCP"
         
         layout.addWidget(mode_combo)
         
@@ -1367,7 +1251,7 @@ class MainWindow(QMainWindow):
         
         # "Static IP" header
         static_header = QLabel("Static IP Settings")
-        static_header.setStyleSheet("color: #00d4ff; font-size: 16px; font-weight: bold; margin-bottom: 5px;")
+        static_header.setObjectName("network_section")
         manual_layout.addWidget(static_header)
         
         # Form layout for fields (same as SIP)
@@ -1375,151 +1259,63 @@ class MainWindow(QMainWindow):
         form_layout.setSpacing(10)
         form_layout.setLabelAlignment(Qt.AlignRight)
         
-        # Style for all input fields (bigger text)
-        input_style = """
-            QLineEdit {
-                background-color: #2d3748;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 6px;
-                padding: 12px;
-                font-size: 16px;
-                min-height: 45px;
-            }
-            QLineEdit:focus {
-                border: 2px solid rgba(0, 212, 255, 0.6);
-            }
-        """
-        
-        # Label style (bigger text)
-        label_style = "color: #eaeaea; font-size: 16px; font-weight: bold;"
-        
-        # IP Address
-        ip_input = QLineEdit()
-        ip_input.setStyleSheet(input_style)
-        ip_input.setPlaceholderText("e.g., 192.168.1.221")
-        if is_static and current_ip != "Unknown":
-            ip_input.setText(current_ip)
-        else:
-            ip_input.setText("192.168.1.221")
-        ip_label = QLabel("IP Address:")
-        ip_label.setStyleSheet(label_style)
-        form_layout.addRow(ip_label, ip_input)
-        
-        # Subnet Mask
-        subnet_input = QLineEdit()
-        subnet_input.setStyleSheet(input_style)
-        subnet_input.setPlaceholderText("e.g., 255.255.255.0")
-        subnet_input.setText("255.255.255.0")
-        subnet_label = QLabel("Subnet Mask:")
-        subnet_label.setStyleSheet(label_style)
-        form_layout.addRow(subnet_label, subnet_input)
-        
-        # Gateway
-        gateway_input = QLineEdit()
-        gateway_input.setStyleSheet(input_style)
-        gateway_input.setPlaceholderText("e.g., 192.168.1.1")
-        if is_static and current_gateway:
-            gateway_input.setText(current_gateway)
-        else:
-            gateway_input.setText("192.168.1.1")
-        gateway_label = QLabel("Gateway:")
-        gateway_label.setStyleSheet(label_style)
-        form_layout.addRow(gateway_label, gateway_input)
-        
-        # DNS Server
-        dns_input = QLineEdit()
-        dns_input.setStyleSheet(input_style)
-        dns_input.setPlaceholderText("e.g., 8.8.8.8")
-        if is_static and current_dns:
-            dns_input.setText(current_dns)
-        else:
-            dns_input.setText("8.8.8.8")
-        dns_label = QLabel("DNS Server:")
-        dns_label.setStyleSheet(label_style)
-        form_layout.addRow(dns_label, dns_input)
+        # IP Address / Subnet Mask / Gateway / DNS Server - stored on the dialog by
+        # attribute name, text is filled in on every open
+        input_fields = []
+        for label_text, attr, placeholder, _default in _NETWORK_FIELDS:
+            field = QLineEdit()
+            field.setPlaceholderText(placeholder)
+            label = QLabel(label_text)
+            label.setObjectName("network_field_label")
+            form_layout.addRow(label, field)
+            setattr(network_dialog, attr, field)
+            input_fields.append(field)
         
         manual_layout.addLayout(form_layout)
         
         manual_config.setVisible(False)  # Hidden by default
         layout.addWidget(manual_config)
         
-        # Show manual config if currently using static IP
-        if is_static:
-            manual_config.setVisible(True)
-        
         # Store input fields and active input for keyboard handling (same pattern as SIP)
-        network_dialog.input_fields = [ip_input, subnet_input, gateway_input, dns_input]
+        network_dialog.input_fields = input_fields
         network_dialog.active_input = None
         
-        # Event filter function for keyboard handling (matches SIP pattern)
-        def network_event_filter(obj, event):
-            """Handle focus events to track active input field and show/hide keyboard"""
-            if event.type() == QEvent.FocusIn:
-                if isinstance(obj, QLineEdit):
-                    network_dialog.active_input = obj
-                    # Highlight active field (bigger font)
-                    obj.setStyleSheet("""
-                        QLineEdit {
-                            background-color: #2d3748;
-                            color: white;
-                            border: 2px solid #00d4ff;
-                            border-radius: 6px;
-                            padding: 12px;
-                            font-size: 16px;
-                            min-height: 45px;
-                        }
-                    """)
-                    # Show keyboard when text field is focused
-                    keyboard.show()
-            elif event.type() == QEvent.FocusOut:
-                if isinstance(obj, QLineEdit):
-                    # Reset field style (bigger font)
-                    obj.setStyleSheet("""
-                        QLineEdit {
-                            background-color: #2d3748;
-                            color: white;
-                            border: 2px solid rgba(0, 212, 255, 0.3);
-                            border-radius: 6px;
-                            padding: 12px;
-                            font-size: 16px;
-                            min-height: 45px;
-                        }
-                    """)
-                    # Hide keyboard when focus leaves text field (with delay to allow keyboard clicks)
-                    QTimer.singleShot(200, lambda: check_hide_keyboard())
-            return False
-        
-        def check_hide_keyboard():
-            """Check if keyboard should be hidden (no text field has focus)"""
-            for field in network_dialog.input_fields:
-                if field.hasFocus():
-                    return  # Don't hide, a field still has focus
-            keyboard.hide()
-        
-        # Install event filter on input fields
-        ip_input.installEventFilter(network_dialog)
-        subnet_input.installEventFilter(network_dialog)
-        gateway_input.installEventFilter(network_dialog)
-        dns_input.installEventFilter(network_dialog)
-        
-        # Override dialog's eventFilter to use our function
-        network_dialog.eventFilter = network_event_filter
+        # Same field/keyboard focus handling as the SIP dialog
+        @pyqtSlot(QWidget, QWidget)
+        def on_focus_changed(old, new):
+            field = track_input_focus(old, new, network_dialog.input_fields, network_dialog.keyboard)
+            if field is not None:
+                network_dialog.active_input = field
+                network_dialog.user_edited = True
         
         # Add spacing before info label
         layout.addSpacing(10)
         
         # Info label (bigger font)
         info_label = QLabel("Tap a field to show keyboard")
-        info_label.setStyleSheet("color: #ffa500; font-size: 13px; font-weight: bold; padding: 5px 0px;")
+        info_label.setObjectName("network_hint")
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
         # Add spacing before keyboard
         layout.addSpacing(8)
         
-        # Virtual Keyboard (same pattern as SIP settings - built into dialog)
-        keyboard = VirtualKeyboard(network_dialog)
+        # Virtual Keyboard slot - the shared keyboard is moved in on every open
+        # and released again when the dialog finishes
+        keyboard_slot = QVBoxLayout()
+        keyboard_slot.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(keyboard_slot)
+        network_dialog.keyboard = None
+        
+        def on_dialog_finished(_result):
+            # Focus is tracked app-wide only while the dialog is open
+            try:
+                QApplication.instance().focusChanged.disconnect(on_focus_changed)
+            except TypeError:
+                pass  # Not connected
+            network_dialog.keyboard.release()
+        
+        network_dialog.finished.connect(on_dialog_finished)
         
         def handle_keyboard_key(key):
             """Handle virtual keyboard key press"""
@@ -1537,15 +1333,10 @@ class MainWindow(QMainWindow):
             if key == '\b':  # Backspace
                 network_dialog.active_input.backspace()
             elif key == '\n':  # Done - hide keyboard
-                keyboard.hide()
+                network_dialog.keyboard.hide()
             else:
                 network_dialog.active_input.insert(key)
         
-        keyboard.key_pressed.connect(handle_keyboard_key)
-        keyboard.close_requested.connect(lambda: keyboard.hide())
-        keyboard.hide()  # Hide keyboard initially
-        layout.addWidget(keyboard)
-        
         # Add spacing between keyboard and buttons
         layout.addSpacing(8)
         
@@ -1558,7 +1349,7 @@ class MainWindow(QMainWindow):
         save_btn.setFocusPolicy(Qt.NoFocus)
         save_btn.setMinimumHeight(50)
         save_btn.setMinimumWidth(150)
-        save_btn.setStyleSheet("font-size: 16px; font-weight: bold;")
+        save_btn.setObjectName("network_save_btn")
         save_btn.clicked.connect(network_dialog.accept)
         button_layout.addWidget(save_btn)
         
@@ -1566,42 +1357,30 @@ class MainWindow(QMainWindow):
         cancel_btn.setFocusPolicy(Qt.NoFocus)
         cancel_btn.setMinimumHeight(50)
         cancel_btn.setMinimumWidth(100)
-        cancel_btn.setStyleSheet("font-size: 16px; font-weight: bold;")
+        cancel_btn.setObjectName("network_cancel_btn")
         cancel_btn.clicked.connect(network_dialog.reject)
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
         
-        # Position dialog at top of screen so keyboard is fully visible
-        from PyQt5.QtWidgets import QApplication
-        screen_geometry = QApplication.primaryScreen().geometry()
-        network_dialog.adjustSize()
-        
-        # Position at top-right of screen
-        x_position = screen_geometry.width() - network_dialog.width() - 50
-        y_position = 20  # Near top of screen
-        network_dialog.move(x_position, y_position)
-        
         # Show keyboard when manual mode is shown
         def on_mode_changed_with_keyboard(index):
+            network_dialog.user_edited = True
             is_manual = mode_combo.currentData() == "manual"
             manual_config.setVisible(is_manual)
-            if not is_manual:
+            if not is_manual and network_dialog.keyboard is not None:
                 # Hide keyboard when switching to DHCP
-                keyboard.hide()
+                network_dialog.keyboard.hide()
             
             # Resize and reposition dialog after mode change
-            network_dialog.adjustSize()
-            screen_geometry = QApplication.primaryScreen().geometry()
-            x_position = screen_geometry.width() - network_dialog.width() - 50
-            y_position = 20
-            network_dialog.move(x_position, y_position)
+            self._place_network_dialog()
         
         mode_combo.currentIndexChanged.connect(on_mode_changed_with_keyboard)
         
         # Handle dialog accepted (Save & Restart button)
         def on_dialog_accepted():
             # Close parent settings dialog first to prevent blocking
+            parent_dialog = self._network_parent
             if parent_dialog:
                 parent_dialog.close()
             
@@ -1613,10 +1392,10 @@ class MainWindow(QMainWindow):
                 self._configure_dhcp()
             elif selected_mode == "manual":
                 # Configure static IP
-                ip = ip_input.text().strip()
-                subnet = subnet_input.text().strip()
-                gateway = gateway_input.text().strip()
-                dns = dns_input.text().strip()
+                ip = network_dialog.ip_input.text().strip()
+                subnet = network_dialog.subnet_input.text().strip()
+                gateway = network_dialog.gateway_input.text().strip()
+                dns = network_dialog.dns_input.text().strip()
                 
                 self._configure_static_ip(ip, subnet, gateway, dns)
             
@@ -1626,6 +1405,7 @@ class MainWindow(QMainWindow):
         def on_dialog_rejected():
             logger.info("Network dialog rejected signal received")
             network_dialog.close()
+            parent_dialog = self._network_parent
             if parent_dialog:
                 parent_dialog.close()
         
@@ -1633,9 +1413,182 @@ class MainWindow(QMainWindow):
         network_dialog.accepted.connect(on_dialog_accepted)
         network_dialog.rejected.connect(on_dialog_rejected)
         
+        # Widgets refreshed on every open
+        network_dialog.ip_info = ip_info
+        network_dialog.mode_combo = mode_combo
+        network_dialog.save_btn = save_btn
+        network_dialog.manual_config = manual_config
+        network_dialog.keyboard_slot = keyboard_slot
+        network_dialog.handle_keyboard_key = handle_keyboard_key
+        network_dialog.on_focus_changed = on_focus_changed
+        
+        self._network_dialog = network_dialog
+        return network_dialog
+    
+    def _place_network_dialog(self):
+        """Size the network dialog to its contents and pin it to the top-right of the screen"""
+        # Position dialog at top of screen so keyboard is fully visible
+        network_dialog = self._network_dialog
+        network_dialog.adjustSize()
+        screen_geometry = self._get_screen_geometry()
+        x_position = screen_geometry.width() - network_dialog.width() - 50
+        y_position = 20  # Near top of screen
+        network_dialog.move(x_position, y_position)
+    
+    def _read_network_settings(self):
+        """
+        Read the current IP and, for a static setup, its gateway and DNS server
+        
+        Returns:
+            (current_ip, is_static, gateway, dns) - gateway/dns are "" when unknown
+        """
+        try:
+            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
+            current_ip = result.stdout.strip().split()[0] if result.stdout else "Unknown"
+        except:
+            current_ip = "Unknown"
+        
+        # Detect current network mode (check if route is static)
+        is_static = False
+        current_gateway = ""
+        current_dns = ""
+        try:
+            # Check if route is static
+            route_result = subprocess.run(['ip', 'route', 'show', 'default'], 
+                                         capture_output=True, text=True, timeout=2)
+            # Several default routes can be listed (e.g. DHCP wlan0 and static eth0) -
+            # any static one makes the setup static
+            for match in _ROUTE_RE.finditer(route_result.stdout):
+                if match.group(2) == 'static':
+                    is_static = True
+                    current_gateway = match.group(1)
+                    break
+            
+            # Get DNS server
+            dns_result = subprocess.run(['resolvectl', 'status', 'eth0'], 
+                                       capture_output=True, text=True, timeout=2)
+            match = _DNS_RE.search(dns_result.stdout)
+            if match:
+                current_dns = match.group(1)
+        except:
+            pass
+        
+        return current_ip, is_static, current_gateway, current_dns
+    
+    def _show_network_settings(self, parent_dialog):
+        """Show network configuration dialog"""
+        parent_dialog.hide()  # Hide menu temporarily
+        self._network_parent = parent_dialog
+        
+        network_dialog = self._get_network_dialog()
+        
+        # Virtual Keyboard - one shared instance, moved into this dialog
+        from .sip_settings import VirtualKeyboard
+        keyboard = VirtualKeyboard.instance(network_dialog)
+        keyboard.key_pressed.connect(network_dialog.handle_keyboard_key)
+        keyboard.close_requested.connect(keyboard.hide)
+        keyboard.hide()  # Hide keyboard initially
+        network_dialog.keyboard_slot.addWidget(keyboard)
+        network_dialog.keyboard = keyboard
+        if network_dialog.active_input:
+            set_input_active(network_dialog.active_input, False)  # Field left focused last time
+        network_dialog.active_input = None
+        network_dialog.user_edited = False
+        
+        # Detection shells out (up to a few seconds) - reuse a recent result, otherwise
+        # open with the defaults and fill in the detected values when the worker reports
+        if self._network_info is not None and not self._network_info_age.hasExpired(_NETWORK_INFO_TTL_MS):
+            self._apply_network_info(self._network_info)
+        else:
+            self._apply_network_info(None)
+            self._start_network_detection()
+        
+        # Track focus app-wide while the dialog is open (disconnected when it finishes)
+        QApplication.instance().focusChanged.connect(network_dialog.on_focus_changed)
+        
+        # Start with no field focused - the reused dialog would otherwise refocus the
+        # field used last time and pop the keyboard straight back up
+        network_dialog.setFocus()
+        
         # Show dialogs (non-blocking)
         network_dialog.show()
     
+    def _apply_network_info(self, info):
+        """Fill the network dialog from detected settings (None = still detecting)"""
+        network_dialog = self._network_dialog
+        # The placeholders below are not the real setup - saving or switching mode
+        # from them would reconfigure the box from made-up values
+        network_dialog.save_btn.setEnabled(info is not None)
+        network_dialog.mode_combo.setEnabled(info is not None)
+        if info is None:
+            network_dialog.ip_info.setText("Current: detecting...")
+            current_ip, is_static, current_gateway, current_dns = "Unknown", False, "", ""
+        else:
+            current_ip, is_static, current_gateway, current_dns = info
+            # Current IP and mode
+            mode_text = "Static IP" if is_static else "DHCP"
+            network_dialog.ip_info.setText(f"Current: {current_ip} ({mode_text})")
+        
+        # Fields start from the detected static setup, or the defaults
+        detected = {}
+        if is_static:
+            detected = {
+                "ip_input": current_ip if current_ip != "Unknown" else "",
+                "gateway_input": current_gateway,
+                "dns_input": current_dns,
+            }
+        for _label, attr, _placeholder, default in _NETWORK_FIELDS:
+            getattr(network_dialog, attr).setText(detected.get(attr) or default)
+        
+        # Set current mode in dropdown and show manual config if currently using static IP
+        network_dialog.mode_combo.blockSignals(True)
+        try:
+            network_dialog.mode_combo.setCurrentIndex(1 if is_static else 0)
+        finally:
+            network_dialog.mode_combo.blockSignals(False)
+        network_dialog.manual_config.setVisible(is_static)
+        
+        self._place_network_dialog()
+    
+    def _start_network_detection(self):
+        """Run _read_network_settings on a worker thread (one at a time)"""
+        if self._network_detecting:
+            return
+        self._network_detecting = True
+        threading.Thread(target=self._network_detection_worker, daemon=True).start()
+    
+    def _network_detection_worker(self):
+        """Detect network settings on a worker thread and hand them to the GUI thread"""
+        try:
+            info = self._read_network_settings()
+        except Exception as e:
+            logger.error(f"Network detection failed: {e}")
+            info = ("Unknown", False, "", "")
+        try:
+            self.network_info_signal.emit(info)
+        except RuntimeError:
+            pass  # Window already destroyed (shutting down)
+    
+    @pyqtSlot(tuple)
+    def _on_network_info(self, info):
+        """Cache detected network settings and show them if the dialog is waiting for them"""
+        self._network_detecting = False
+        self._network_info = info
+        self._network_info_age.start()
+        
+        network_dialog = self._network_dialog
+        if network_dialog is None or not network_dialog.isVisible():
+            return
+        network_dialog.save_btn.setEnabled(True)
+        network_dialog.mode_combo.setEnabled(True)
+        if network_dialog.user_edited:
+            # Keep what the user has typed/picked - only report the current setup
+            current_ip, is_static = info[0], info[1]
+            mode_text = "Static IP" if is_static else "DHCP"
+            network_dialog.ip_info.setText(f"Current: {current_ip} ({mode_text})")
+            return
+        self._apply_network_info(info)
+    
     def _detect_network_type(self):
         """Detect if system uses netplan or dhcpcd"""
         try:
@@ -1949,30 +1902,51 @@ static domain_name_servers={dns}
     
     
     
+    @pyqtSlot('QWindow*')
+    def _watch_window(self, window):
+        """Filter mouse movement on a newly focused top-level window (installing twice is harmless)"""
+        if window is not None:
+            window.installEventFilter(self)
+    
     def eventFilter(self, obj, event):
-        """Application-wide event filter to detect mouse movement"""
-        if event.type() == QEvent.MouseMove:
+        """Top-level window event filter to detect mouse movement"""
+        if event.type() != _MOUSE_MOVE:
+            return False
+        
+        # While the cursor is visible, restarting the hide timer at most every
+        # 250ms is plenty - drags deliver far more MouseMove events than that
+        if not self.cursor_visible or self._cursor_reset_clock.elapsed() > _CURSOR_RESET_THROTTLE_MS:
             self._show_cursor()
-            self.cursor_hide_timer.start(3000)  # Hide after 3 seconds
-        return super().eventFilter(obj, event)
+            self.cursor_hide_timer.start()
+            self._cursor_reset_clock.restart()
+        return False
     
     def _show_cursor(self):
         """Show the mouse cursor"""
         if not self.cursor_visible:
-            QCoreApplication.instance().restoreOverrideCursor()
+            self._qapp.restoreOverrideCursor()
             self.cursor_visible = True
-            logger.info("Mouse cursor shown")
+            logger.debug("Mouse cursor shown")
     
+    @pyqtSlot()
     def _hide_cursor(self):
         """Hide the mouse cursor after inactivity"""
         if self.cursor_visible:
-            QCoreApplication.instance().setOverrideCursor(Qt.BlankCursor)
+            self._qapp.setOverrideCursor(Qt.BlankCursor)
             self.cursor_visible = False
-            logger.info("Mouse cursor hidden")
+            logger.debug("Mouse cursor hidden")
     
     def closeEvent(self, event):
         """Handle window close"""
+        self.sip_engine.on_line_state_change = None
         self.update_timer.stop()
+        self._refresh_timer.stop()
         self.cursor_hide_timer.stop()
-        QCoreApplication.instance().removeEventFilter(self)
+        # Window filters go away with their windows; just stop adopting new ones
+        # (only unhooked if the application lives on past this window)
+        if not self._qapp.closingDown():
+            try:
+                self._qapp.focusWindowChanged.disconnect(self._watch_window)
+            except TypeError:
+                pass  # TOUCHSCREEN_ONLY - never connected
         event.accept()
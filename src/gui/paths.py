@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Config Paths - config files the GUI reads, resolved once relative to this file
+"""
+
+from pathlib import Path
+
+# Config files live in <repo>/config
+CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / 'config'
+
+# Global Qt stylesheet applied by the main window
+STYLESHEET_PATH = CONFIG_DIR / 'styles.css'
+
+# SIP account settings edited by the SIP settings dialog
+SIP_CONFIG_PATH = CONFIG_DIR / 'sip_config.json'
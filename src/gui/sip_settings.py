@@ -1,22 +1,123 @@
 #!/usr/bin/env python3
 """
-SIP Settings Dialog - Configure SIP Provider Credentials
+SIP Settings Dialog - SIP account settings with the on-screen keyboard
+
+Imported on first use by the main window, so the dialog and its keyboard
+are not built (or imported) until an operator opens SIP settings.
 """
 
 import json
 import os
+from functools import lru_cache
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton,
+                             QLabel, QMessageBox, QComboBox, QDialog, QLineEdit, QFormLayout,
+                             QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QIntValidator, QPixmap, QPainter, QLinearGradient, QColor
 import logging
-from PyQt5.QtWidgets import (QWidget, QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-                             QPushButton, QLabel, QLineEdit, QComboBox, 
-                             QFormLayout, QMessageBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QEvent
-from PyQt5.QtGui import QFont
+
+from .fonts import ui_font
+from .input_focus import set_input_active, track_input_focus
+from .paths import SIP_CONFIG_PATH
+
+try:
+    import orjson  # Optional - faster config parse/serialize, stdlib json otherwise
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_CONFIG_PATH = str(SIP_CONFIG_PATH)
+
+# Parsed SIP config per path: path -> (st_mtime_ns, config dict)
+_CONFIG_CACHE = {}
+
+# On-screen keyboard shared by the SIP and network dialogs (see VirtualKeyboard.instance)
+_SHARED_KEYBOARD = None
+
+# Virtual keyboard - one sheet on the container styles every key
+_KEYBOARD_QSS = """
+    VirtualKeyboard { background-color: #18181b; border-radius: 12px; }
+    QPushButton { background-color: #3f3f46; color: white; border: none; border-radius: 8px; font-size: 20px; }
+    QPushButton:pressed { background-color: #52525b; }
+    QPushButton#key_delete { background-color: #f97316; font-size: 18px; font-weight: bold; }
+    QPushButton#key_delete:pressed { background-color: #ea580c; }
+    QPushButton#key_done { background-color: #22c55e; font-size: 18px; font-weight: bold; }
+    QPushButton#key_done:pressed { background-color: #16a34a; }
+"""
+
+# SIP settings dialog theme - the focused field is marked with active="true"
+# (the dialog background gradient is pre-rendered, see _dialog_background)
+_SIP_DIALOG_QSS = """
+    QLabel {
+        color: #eaeaea;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QLineEdit, QSpinBox {
+        background-color: #2d3748;
+        color: white;
+        border: 2px solid rgba(0, 212, 255, 0.3);
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 13px;
+        min-height: 35px;
+    }
+    QLineEdit:focus, QSpinBox:focus {
+        border: 2px solid rgba(0, 212, 255, 0.6);
+    }
+    QLineEdit[active="true"] {
+        border: 2px solid #00d4ff;
+    }
+    QPushButton {
+        background-color: #4a5568;
+        color: white;
+        border: 2px solid rgba(0, 212, 255, 0.3);
+        border-radius: 8px;
+        padding: 12px 24px;
+        font-size: 14px;
+        font-weight: bold;
+        min-height: 45px;
+    }
+    QPushButton:hover {
+        background-color: #5a6578;
+        border: 2px solid rgba(0, 212, 255, 0.5);
+    }
+    QPushButton:pressed {
+        background-color: #3d4758;
+    }
+"""
+
+
+def _parse_config(data: bytes) -> dict:
+    """Parse SIP config file contents"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _serialize_config(config: dict) -> bytes:
+    """Serialize the SIP config as 2-space indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+@lru_cache(maxsize=4)
+def _dialog_background(width: int, height: int) -> QPixmap:
+    """Render the SIP dialog's diagonal gradient once per size (blitted on repaint)"""
+    pixmap = QPixmap(width, height)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor("#1a1a2e"))
+    gradient.setColorAt(1, QColor("#16213e"))
+    painter = QPainter(pixmap)
+    painter.fillRect(pixmap.rect(), gradient)
+    painter.end()
+    return pixmap
+
 
 class VirtualKeyboard(QWidget):
-    """Simple on-screen keyboard"""
+    """Modern virtual on-screen keyboard matching tvOS design"""
     
     key_pressed = pyqtSignal(str)
     close_requested = pyqtSignal()
@@ -24,158 +125,183 @@ class VirtualKeyboard(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.shift_active = False
-        self.setFixedHeight(180)
+        self._labels_shifted = False  # Case the key labels currently show
+        self.setFixedHeight(310)
+        # Handlers for the non-character keys, looked up once per key press
+        self._special_keys = {
+            'ABC': self._toggle_shift,
+            'SPACE': self._emit_space,
+            'DEL': self._emit_backspace,
+            'Done': self._emit_done,
+        }
         self._create_ui()
     
-    def _create_ui(self):
-        """Create compact keyboard"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(4)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        self.setStyleSheet("background-color: #1e293b; border-radius: 8px;")
+    @classmethod
+    def instance(cls, parent):
+        """
+        Return the shared keyboard, moved into parent with its old connections dropped
         
-        btn_style = """
-            QPushButton {
-                background-color: #475569;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                min-width: 30px;
-            }
-            QPushButton:pressed { background-color: #64748b; }
+        The caller connects key_pressed/close_requested and should call release()
+        when its dialog closes so the keyboard outlives the dialog.
         """
+        global _SHARED_KEYBOARD
+        keyboard = _SHARED_KEYBOARD
+        if keyboard is None:
+            keyboard = _SHARED_KEYBOARD = cls(parent)
+            return keyboard
+        
+        for signal in (keyboard.key_pressed, keyboard.close_requested):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing connected
+        keyboard.setParent(parent)
+        if keyboard.shift_active:
+            keyboard.shift_active = False
+            keyboard.key_buttons['ABC'].setChecked(False)
+            keyboard._update_key_labels()
+        return keyboard
+    
+    def release(self):
+        """Detach from the current dialog so the keyboard is not destroyed with it"""
+        self.hide()
+        self.setParent(None)
+    
+    def _create_ui(self):
+        """Create tvOS-style keyboard layout using grid"""
+        # Use grid layout for precise positioning
+        grid = QGridLayout(self)
+        grid.setSpacing(8)
+        grid.setContentsMargins(15, 12, 15, 12)
+        
+        # Background and every key style come from one shared sheet - set before
+        # the keys exist, and each key is created already parented to the keyboard,
+        # so it is styled once at construction instead of again when the grid
+        # adopts it
+        self.setStyleSheet(_KEYBOARD_QSS)
+        
+        # Keyboard letters - 4 rows of 10 each (stored as uppercase for key reference)
+        rows = [
+            ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j'],
+            ['k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't'],
+            ['u', 'v', 'w', 'x', 'y', 'z', '0', '1', '2', '3'],
+            ['4', '5', '6', '7', '8', '9', '+', '-', '.', '@']
+        ]
         
         self.key_buttons = {}
         
-        # Row 1: 1234567890
-        row1 = QHBoxLayout()
-        row1.setSpacing(4)
-        for key in ['1','2','3','4','5','6','7','8','9','0']:
-            btn = QPushButton(key)
-            btn.setFixedHeight(28)
-            btn.setStyleSheet(btn_style)
-            btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda ch, k=key: self.key_pressed.emit(k))
-            row1.addWidget(btn)
-            self.key_buttons[key] = btn
-        layout.addLayout(row1)
-        
-        # Row 2: qwertyuiop
-        row2 = QHBoxLayout()
-        row2.setSpacing(4)
-        for key in ['q','w','e','r','t','y','u','i','o','p']:
-            btn = QPushButton(key)
-            btn.setFixedHeight(28)
-            btn.setStyleSheet(btn_style)
-            btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda ch, k=key: self._type_key(k))
-            row2.addWidget(btn)
-            self.key_buttons[key] = btn
-        layout.addLayout(row2)
-        
-        # Row 3: asdfghjkl
-        row3 = QHBoxLayout()
-        row3.setSpacing(4)
-        for key in ['a','s','d','f','g','h','j','k','l']:
-            btn = QPushButton(key)
-            btn.setFixedHeight(28)
-            btn.setStyleSheet(btn_style)
-            btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda ch, k=key: self._type_key(k))
-            row3.addWidget(btn)
-            self.key_buttons[key] = btn
-        layout.addLayout(row3)
-        
-        # Row 4: shift zxcvbnm backspace
-        row4 = QHBoxLayout()
-        row4.setSpacing(4)
-        
-        shift = QPushButton('⇧')
-        shift.setFixedHeight(28)
-        shift.setFixedWidth(50)
-        shift.setCheckable(True)
-        shift.setStyleSheet(btn_style)
-        shift.setFocusPolicy(Qt.NoFocus)
-        shift.clicked.connect(self._toggle_shift)
-        row4.addWidget(shift)
-        self.key_buttons['shift'] = shift
-        
-        for key in ['z','x','c','v','b','n','m']:
-            btn = QPushButton(key)
-            btn.setFixedHeight(28)
-            btn.setStyleSheet(btn_style)
-            btn.setFocusPolicy(Qt.NoFocus)
-            btn.clicked.connect(lambda ch, k=key: self._type_key(k))
-            row4.addWidget(btn)
-            self.key_buttons[key] = btn
-        
-        backsp = QPushButton('⌫')
-        backsp.setFixedHeight(28)
-        backsp.setFixedWidth(50)
-        backsp.setStyleSheet("QPushButton { background-color: #dc2626; color: white; border: none; border-radius: 4px; font-size: 16px; } QPushButton:pressed { background-color: #b91c1c; }")
-        backsp.setFocusPolicy(Qt.NoFocus)
-        backsp.clicked.connect(lambda: self.key_pressed.emit('\b'))
-        row4.addWidget(backsp)
-        layout.addLayout(row4)
-        
-        # Row 5: @./ space . done
-        row5 = QHBoxLayout()
-        row5.setSpacing(4)
-        
-        special = QPushButton('@')
-        special.setFixedHeight(28)
-        special.setFixedWidth(40)
-        special.setStyleSheet(btn_style)
-        special.setFocusPolicy(Qt.NoFocus)
-        special.clicked.connect(lambda: self.key_pressed.emit('@'))
-        row5.addWidget(special)
-        
-        space = QPushButton('Space')
-        space.setFixedHeight(28)
-        space.setStyleSheet(btn_style)
-        space.setFocusPolicy(Qt.NoFocus)
-        space.clicked.connect(lambda: self.key_pressed.emit(' '))
-        row5.addWidget(space, 1)
-        
-        dot = QPushButton('.')
-        dot.setFixedHeight(28)
-        dot.setFixedWidth(40)
-        dot.setStyleSheet(btn_style)
-        dot.setFocusPolicy(Qt.NoFocus)
-        dot.clicked.connect(lambda: self.key_pressed.emit('.'))
-        row5.addWidget(dot)
-        
-        done = QPushButton('Done')
-        done.setFixedHeight(28)
-        done.setFixedWidth(60)
-        done.setStyleSheet("QPushButton { background-color: #16a34a; color: white; border: none; border-radius: 4px; font-weight: bold; } QPushButton:pressed { background-color: #15803d; }")
-        done.setFocusPolicy(Qt.NoFocus)
-        done.clicked.connect(self.close_requested.emit)
-        row5.addWidget(done)
-        layout.addLayout(row5)
+        # Add character keys to grid
+        for row_idx, row in enumerate(rows):
+            for col_idx, key in enumerate(row):
+                btn = QPushButton(key, self)
+                btn.setFocusPolicy(Qt.NoFocus)
+                btn.setFixedHeight(48)
+                btn.setProperty("key", key)
+                btn.clicked.connect(self._key_clicked)
+                grid.addWidget(btn, row_idx, col_idx)
+                self.key_buttons[key] = btn
+        
+        # Letter keys are the only ones relabelled by shift - both cases precomputed
+        self._letter_buttons = [(btn, k.lower(), k.upper()) for k, btn in self.key_buttons.items() if k.isalpha()]
+        self._shifted_chars = {k: k.upper() for k in self.key_buttons if k.isalpha()}
+        
+        # Bottom row (row 4) - abc spans 2 cols, Space spans 4 cols, Delete spans 2 cols, Done spans 2 cols
+        # abc button
+        abc_btn = QPushButton('abc', self)
+        abc_btn.setFocusPolicy(Qt.NoFocus)
+        abc_btn.setFixedHeight(52)
+        abc_btn.setCheckable(True)
+        abc_btn.setProperty("key", 'ABC')
+        abc_btn.clicked.connect(self._key_clicked)
+        grid.addWidget(abc_btn, 4, 0, 1, 2)
+        self.key_buttons['ABC'] = abc_btn
+        
+        # Space button
+        space_btn = QPushButton('Space', self)
+        space_btn.setFocusPolicy(Qt.NoFocus)
+        space_btn.setFixedHeight(52)
+        space_btn.setProperty("key", 'SPACE')
+        space_btn.clicked.connect(self._key_clicked)
+        grid.addWidget(space_btn, 4, 2, 1, 4)
+        
+        # Delete button (orange)
+        delete_btn = QPushButton('Delete', self)
+        delete_btn.setFocusPolicy(Qt.NoFocus)
+        delete_btn.setFixedHeight(52)
+        delete_btn.setObjectName("key_delete")
+        delete_btn.setProperty("key", 'DEL')
+        delete_btn.clicked.connect(self._key_clicked)
+        grid.addWidget(delete_btn, 4, 6, 1, 2)
+        
+        # Done button (green)
+        done_btn = QPushButton('Done', self)
+        done_btn.setFocusPolicy(Qt.NoFocus)
+        done_btn.setFixedHeight(52)
+        done_btn.setObjectName("key_done")
+        done_btn.setProperty("key", 'Done')
+        done_btn.clicked.connect(self._key_clicked)
+        grid.addWidget(done_btn, 4, 8, 1, 2)
     
-    def _type_key(self, key):
-        char = key.upper() if self.shift_active else key
-        self.key_pressed.emit(char)
-        if self.shift_active:
+    @pyqtSlot()
+    def _key_clicked(self):
+        """Shared slot for every key button - the key is stored on the button"""
+        btn = self.sender()
+        if btn is not None:
+            self._on_key_click(btn.property("key"))
+    
+    def _on_key_click(self, key):
+        """Handle key press"""
+        handler = self._special_keys.get(key)
+        if handler is not None:
+            handler()
+        else:
+            self._emit_char(key)
+    
+    def _emit_char(self, key):
+        """Emit a character key, releasing shift after a letter"""
+        # Keys are stored lowercase - only letters have a shifted form
+        shifted = self._shifted_chars.get(key) if self.shift_active else None
+        if shifted is None:
+            self.key_pressed.emit(key)
+        else:
+            self.key_pressed.emit(shifted)
             self.shift_active = False
-            self.key_buttons['shift'].setChecked(False)
-            self._update_labels()
+            self.key_buttons['ABC'].setChecked(False)
+            self._update_key_labels()
     
     def _toggle_shift(self):
-        self.shift_active = self.key_buttons['shift'].isChecked()
-        self._update_labels()
+        """ABC key - follow the button's checked state"""
+        self.shift_active = self.key_buttons['ABC'].isChecked()
+        self._update_key_labels()
+    
+    def _emit_space(self):
+        self.key_pressed.emit(' ')
     
-    def _update_labels(self):
-        for key in 'qwertyuiopasdfghjklzxcvbnm':
-            if key in self.key_buttons:
-                self.key_buttons[key].setText(key.upper() if self.shift_active else key)
+    def _emit_backspace(self):
+        self.key_pressed.emit('\b')
+    
+    def _emit_done(self):
+        self.key_pressed.emit('\n')
+        self.close_requested.emit()
+    
+    def _update_key_labels(self):
+        """Update key labels based on shift state"""
+        upper = self.shift_active
+        if upper == self._labels_shifted:
+            return  # Labels already show this case
+        self._labels_shifted = upper
+        # Relabel every key in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            for btn, lower_text, upper_text in self._letter_buttons:
+                btn.setText(upper_text if upper else lower_text)
+            self.key_buttons['ABC'].setText('ABC' if upper else 'abc')
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class SIPSettingsDialog(QDialog):
-    """Dialog for configuring SIP provider credentials"""
+    """Dialog for configuring SIP credentials"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -184,67 +310,33 @@ class SIPSettingsDialog(QDialog):
         self.setMinimumWidth(800)
         self.setMinimumHeight(850)  # Increased for keyboard + buttons
         
+        # Current active input field
         self.active_input = None
         
-        # Get config path
-        script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.config_path = os.path.join(script_dir, "config", "sip_config.json")
+        # Load current config - use path relative to script location
+        self.config_path = _CONFIG_PATH
         self.load_config()
         
-        self._apply_theme()
+        # Apply dark theme
+        self.setStyleSheet(_SIP_DIALOG_QSS)
+        
         self._create_ui()
     
-    def _apply_theme(self):
-        """Apply dark theme"""
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #1a1a2e, stop:1 #16213e);
-            }
-            QLabel {
-                color: #eaeaea;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QLineEdit {
-                background-color: #2d3748;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-                min-height: 35px;
-            }
-            QLineEdit:focus {
-                border: 2px solid rgba(0, 212, 255, 0.6);
-            }
-            QPushButton {
-                background-color: #4a5568;
-                color: white;
-                border: 2px solid rgba(0, 212, 255, 0.3);
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #5a6578;
-                border: 2px solid rgba(0, 212, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background-color: #3d4758;
-            }
-        """)
-    
     def load_config(self):
-        """Load current SIP configuration"""
+        """Load current SIP configuration (parsed JSON is cached until the file changes)"""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            mtime = os.stat(self.config_path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(self.config_path)
+            if cached and cached[0] == mtime:
+                self.config = dict(cached[1])
+                return
+            with open(self.config_path, 'rb') as f:
+                self.config = _parse_config(f.read())
+            _CONFIG_CACHE[self.config_path] = (mtime, dict(self.config))
         except Exception as e:
             logger.error(f"Failed to load SIP config: {e}")
             self.config = {
-                "sip_server": "sip.twilio.com",
+                "sip_server": "sip.example.com",
                 "sip_port": 5060,
                 "transport": "UDP",
                 "username": "",
@@ -261,7 +353,7 @@ class SIPSettingsDialog(QDialog):
         
         # Title
         title = QLabel("SIP Trunk Configuration")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(ui_font(16))
         title.setStyleSheet("color: #00d4ff; margin-bottom: 5px;")
         layout.addWidget(title)
         
@@ -270,19 +362,20 @@ class SIPSettingsDialog(QDialog):
         form_layout.setSpacing(8)
         form_layout.setLabelAlignment(Qt.AlignRight)
         
+        # Create all input fields - focus moves between them are tracked app-wide
+        # (see _on_focus_changed) rather than through per-field event filters
         self.input_fields = []
         
         # SIP Server
         self.server_input = QLineEdit(self.config.get("sip_server", ""))
         self.server_input.setPlaceholderText("e.g., sip.vonage.com")
-        self.server_input.installEventFilter(self)
         self.input_fields.append(self.server_input)
         form_layout.addRow("SIP Server:", self.server_input)
         
         # SIP Port (text input for virtual keyboard)
         self.port_input = QLineEdit(str(self.config.get("sip_port", 5060)))
+        self.port_input.setValidator(QIntValidator(1, 65535, self))  # Only valid ports can be typed
         self.port_input.setPlaceholderText("5060")
-        self.port_input.installEventFilter(self)
         self.input_fields.append(self.port_input)
         form_layout.addRow("SIP Port:", self.port_input)
         
@@ -316,7 +409,6 @@ class SIPSettingsDialog(QDialog):
         # Username
         self.username_input = QLineEdit(self.config.get("username", ""))
         self.username_input.setPlaceholderText("SIP Username")
-        self.username_input.installEventFilter(self)
         self.input_fields.append(self.username_input)
         form_layout.addRow("Username:", self.username_input)
         
@@ -324,25 +416,23 @@ class SIPSettingsDialog(QDialog):
         self.password_input = QLineEdit(self.config.get("password", ""))
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setPlaceholderText("SIP Password")
-        self.password_input.installEventFilter(self)
         self.input_fields.append(self.password_input)
         form_layout.addRow("Password:", self.password_input)
         
         # Caller ID Name
         self.callerid_name_input = QLineEdit(self.config.get("caller_id_name", ""))
         self.callerid_name_input.setPlaceholderText("e.g., Production Phone")
-        self.callerid_name_input.installEventFilter(self)
         self.input_fields.append(self.callerid_name_input)
         form_layout.addRow("Caller ID Name:", self.callerid_name_input)
         
         # Caller ID Number
         self.callerid_number_input = QLineEdit(self.config.get("caller_id_number", ""))
         self.callerid_number_input.setPlaceholderText("e.g., +1234567890")
-        self.callerid_number_input.installEventFilter(self)
         self.input_fields.append(self.callerid_number_input)
         form_layout.addRow("Caller ID Number:", self.callerid_number_input)
         
         layout.addLayout(form_layout)
+        
         # Add spacing before info label
         layout.addSpacing(15)
         
@@ -356,14 +446,12 @@ class SIPSettingsDialog(QDialog):
         # Add spacing before keyboard
         layout.addSpacing(10)
         
-        layout.addSpacing(10)
-        
-        # Virtual Keyboard
-        self.keyboard = VirtualKeyboard(self)
-        self.keyboard.key_pressed.connect(self._on_keyboard_key)
-        self.keyboard.close_requested.connect(self._hide_keyboard)
-        self.keyboard.hide()  # Hide keyboard initially
-        layout.addWidget(self.keyboard)
+        # Virtual Keyboard slot - the shared keyboard is moved in on every show
+        # and released again on hide
+        self._keyboard_slot = QVBoxLayout()
+        self._keyboard_slot.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(self._keyboard_slot)
+        self.keyboard = None
         
         # Buttons - always visible at bottom
         button_layout = QHBoxLayout()
@@ -384,70 +472,64 @@ class SIPSettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def paintEvent(self, event):
+        """Copy the cached gradient instead of re-filling it on every repaint"""
+        painter = QPainter(self)
+        painter.drawPixmap(event.rect(), _dialog_background(self.width(), self.height()), event.rect())
+    
+    def reload(self):
+        """Re-read the config and refresh the fields so a cached dialog can be reopened"""
+        self.load_config()
+        self.server_input.setText(self.config.get("sip_server", ""))
+        self.port_input.setText(str(self.config.get("sip_port", 5060)))
+        self.transport_input.setCurrentText(self.config.get("transport", "UDP"))
+        self.username_input.setText(self.config.get("username", ""))
+        self.password_input.setText(self.config.get("password", ""))
+        self.callerid_name_input.setText(self.config.get("caller_id_name", ""))
+        self.callerid_number_input.setText(self.config.get("caller_id_number", ""))
+    
     def showEvent(self, event):
         """Handle dialog show - ensure keyboard starts hidden"""
         super().showEvent(event)
+        # Virtual Keyboard - one shared instance, moved into this dialog
+        self.keyboard = VirtualKeyboard.instance(self)
+        self.keyboard.key_pressed.connect(self._on_keyboard_key)
+        self.keyboard.close_requested.connect(self._hide_keyboard)
+        self._keyboard_slot.addWidget(self.keyboard)
+        # Track focus app-wide only while the dialog is on screen
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
         # Clear any automatic focus and hide keyboard
         self.setFocus()  # Move focus to dialog itself
         self.keyboard.hide()
+        if self.active_input:
+            set_input_active(self.active_input, False)  # Field left focused last time
         self.active_input = None
     
+    def hideEvent(self, event):
+        """Stop tracking focus once the dialog is hidden"""
+        try:
+            QApplication.instance().focusChanged.disconnect(self._on_focus_changed)
+        except TypeError:
+            pass  # Not connected
+        # Hand the keyboard back so the network dialog can take it
+        self.keyboard.release()
+        super().hideEvent(event)
+    
+    @pyqtSlot()
     def _hide_keyboard(self):
         """Hide the virtual keyboard"""
         self.keyboard.hide()
         if self.active_input:
             self.active_input.clearFocus()
     
-    def _show_keyboard(self):
-        """Show the virtual keyboard"""
-        self.keyboard.show()
-    
-    def eventFilter(self, obj, event):
-        """Handle focus events to track active input field and show/hide keyboard"""
-        if event.type() == QEvent.FocusIn:
-            if isinstance(obj, QLineEdit):
-                self.active_input = obj
-                # Highlight active field
-                obj.setStyleSheet("""
-                    QLineEdit {
-                        background-color: #2d3748;
-                        color: white;
-                        border: 2px solid #00d4ff;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: 13px;
-                        min-height: 35px;
-                    }
-                """)
-                # Show keyboard when text field is focused
-                self._show_keyboard()
-        elif event.type() == QEvent.FocusOut:
-            if isinstance(obj, QLineEdit):
-                # Reset field style
-                obj.setStyleSheet("""
-                    QLineEdit {
-                        background-color: #2d3748;
-                        color: white;
-                        border: 2px solid rgba(0, 212, 255, 0.3);
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: 13px;
-                        min-height: 35px;
-                    }
-                """)
-                # Hide keyboard when focus leaves text field (with slight delay to allow keyboard clicks)
-                QTimer.singleShot(200, self._check_hide_keyboard)
-        return super().eventFilter(obj, event)
-    
-    def _check_hide_keyboard(self):
-        """Check if keyboard should be hidden (no text field has focus)"""
-        # Check if any input field currently has focus
-        for field in self.input_fields:
-            if field.hasFocus():
-                return  # Don't hide, a field still has focus
-        # No text field has focus, hide keyboard and show buttons
-        self._hide_keyboard()
+    @pyqtSlot(QWidget, QWidget)
+    def _on_focus_changed(self, old, new):
+        """Track the active field and show/hide the keyboard as focus moves"""
+        field = track_input_focus(old, new, self.input_fields, self.keyboard)
+        if field is not None:
+            self.active_input = field
     
+    @pyqtSlot(str)
     def _on_keyboard_key(self, key):
         """Handle virtual keyboard key press"""
         if not self.active_input:
@@ -467,30 +549,42 @@ class SIPSettingsDialog(QDialog):
         else:
             self.active_input.insert(key)
     
+    @pyqtSlot()
     def save_settings(self):
         """Save settings to config file"""
         try:
             # Update config
             self.config["sip_server"] = self.server_input.text()
-            # Convert port text to integer, default to 5060 if invalid
-            try:
-                port = int(self.port_input.text())
-                if port < 1 or port > 65535:
-                    port = 5060
-            except ValueError:
-                port = 5060
-            self.config["sip_port"] = port
+            # Validator guarantees digits in range (or an empty/partial field) - default to 5060
+            if self.port_input.hasAcceptableInput():
+                self.config["sip_port"] = int(self.port_input.text())
+            else:
+                self.config["sip_port"] = 5060
             self.config["transport"] = self.transport_input.currentText()
             self.config["username"] = self.username_input.text()
             self.config["password"] = self.password_input.text()
             self.config["caller_id_name"] = self.callerid_name_input.text()
             self.config["caller_id_number"] = self.callerid_number_input.text()
             
-            # Write to file
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write to file - skip if nothing changed, otherwise replace atomically
+            new_json = _serialize_config(self.config)
+            try:
+                with open(self.config_path, 'rb') as f:
+                    unchanged = f.read() == new_json
+            except OSError:
+                unchanged = False
             
-            logger.info("SIP settings saved successfully")
+            if unchanged:
+                logger.info("SIP settings unchanged - config file not rewritten")
+            else:
+                tmp_path = self.config_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(new_json)
+                    f.flush()
+                    os.fsync(f.fileno())  # Survive power loss on the Pi
+                os.replace(tmp_path, self.config_path)
+                _CONFIG_CACHE.pop(self.config_path, None)
+                logger.info("SIP settings saved successfully")
             
             # Show success message
             QMessageBox.information(
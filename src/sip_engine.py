@@ -12,7 +12,7 @@ import time
 import re
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 
 from .phone_line import PhoneLine, LineState
 
@@ -407,10 +407,20 @@ class SIPEngine:
         self.config: Dict[str, Any] = {}
         self.is_running = False
         
+        # Listener for line state transitions: (line_id, old_state, new_state)
+        # Called from Baresip monitor threads - listeners must be thread-safe
+        self.on_line_state_change: Optional[Callable] = None
+        
         for i in range(1, num_lines + 1):
             line = PhoneLine(line_id=i)
+            line.on_state_change = self._notify_state_change
             self.lines.append(line)
     
+    def _notify_state_change(self, line_id: int, old_state: LineState, new_state: LineState) -> None:
+        """Forward a line state transition to the registered listener"""
+        if self.on_line_state_change:
+            self.on_line_state_change(line_id, old_state, new_state)
+    
     def load_config(self, config_path: str = "config/sip_config.json") -> bool:
         """Load SIP configuration from JSON file"""
         try:
@@ -577,6 +587,23 @@ class SIPEngine:
             return self.lines[line_id - 1]
         return None
     
+    def get_lines_snapshot(self) -> List[tuple]:
+        """
+        Get the state and output channel of every line in one call
+        
+        Lines are read one after another without taking their locks. Each line's
+        state is read once and availability is derived from it, so a tuple never
+        pairs a state with an availability that disagrees with it.
+        
+        Returns:
+            List of (line_id, state, output_channel, available) tuples in line order
+        """
+        snapshot = []
+        for line in self.lines:
+            state = line.state
+            snapshot.append((line.line_id, state, line.audio_output.channel, state == LineState.IDLE))
+        return snapshot
+    
     def get_available_lines(self) -> List[PhoneLine]:
         """Get list of available lines"""
         return [line for line in self.lines if line.is_available()]
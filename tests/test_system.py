@@ -4,15 +4,27 @@ Test suite for Phone System components
 Run this to verify your installation
 """
 
+import os
 import sys
+import json
+import shutil
+import tempfile
 import subprocess
 import unittest
+from unittest import mock
 import logging
 
 # Suppress logs during tests
 logging.basicConfig(level=logging.ERROR)
 
 
+def _qt_app():
+    """Return the QApplication for GUI tests (offscreen, created once)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
 class TestImports(unittest.TestCase):
     """Test that all required packages can be imported"""
     
@@ -95,6 +107,238 @@ class TestPhoneLine(unittest.TestCase):
         self.assertIn("+15551234567", line.get_status_string())
 
 
+class TestSIPEngineLines(unittest.TestCase):
+    """Test SIPEngine line snapshot and state listener (no Baresip needed)"""
+    
+    def setUp(self):
+        from src.sip_engine import SIPEngine
+        from src.phone_line import LineState
+        self.engine = SIPEngine(num_lines=4)
+        self.LineState = LineState
+    
+    def test_lines_snapshot(self):
+        """Test snapshot contents follow line state and channel"""
+        snapshot = self.engine.get_lines_snapshot()
+        self.assertEqual(snapshot, [(i, self.LineState.IDLE, 0, True) for i in range(1, 5)])
+        
+        line = self.engine.get_line(2)
+        line.dial("+15551234567")
+        line.set_audio_channel(3)
+        snapshot = self.engine.get_lines_snapshot()
+        self.assertEqual(snapshot[1], (2, self.LineState.DIALING, 3, False))
+        self.assertEqual(snapshot[0], (1, self.LineState.IDLE, 0, True))
+    
+    def test_state_change_listener(self):
+        """Test set_state notifies the engine's line state listener"""
+        calls = []
+        self.engine.on_line_state_change = lambda *args: calls.append(args)
+        
+        self.engine.get_line(1).set_state(self.LineState.DIALING)
+        self.assertEqual(calls, [(1, self.LineState.IDLE, self.LineState.DIALING)])
+        
+        # Same state is a no-op - no notification
+        self.engine.get_line(1).set_state(self.LineState.DIALING)
+        self.assertEqual(len(calls), 1)
+
+
+class TestNetworkDialog(unittest.TestCase):
+    """Test the network settings dialog while detection is running"""
+    
+    def setUp(self):
+        self.app = _qt_app()
+        from PyQt5.QtWidgets import QDialog
+        from src.sip_engine import SIPEngine
+        from src.gui.main_window import MainWindow
+        self.window = MainWindow(SIPEngine(), None)
+        self.menu = QDialog(self.window)
+    
+    def tearDown(self):
+        self.window.close()
+        self.window.deleteLater()
+    
+    def test_save_disabled_until_detected(self):
+        """Test Save and the mode picker stay disabled until detection reports"""
+        # Pretend a detection is already running so no worker thread is started
+        self.window._network_detecting = True
+        self.window._show_network_settings(self.menu)
+        dialog = self.window._network_dialog
+        self.assertFalse(dialog.save_btn.isEnabled())
+        self.assertFalse(dialog.mode_combo.isEnabled())
+        
+        self.window._on_network_info(("192.168.1.50", True, "192.168.1.1", "1.1.1.1"))
+        self.assertTrue(dialog.save_btn.isEnabled())
+        self.assertTrue(dialog.mode_combo.isEnabled())
+        self.assertEqual(dialog.mode_combo.currentData(), "manual")
+        self.assertEqual(dialog.ip_input.text(), "192.168.1.50")
+        self.assertEqual(dialog.gateway_input.text(), "192.168.1.1")
+        self.assertEqual(dialog.dns_input.text(), "1.1.1.1")
+        dialog.close()
+
+
+class TestChannelOwnership(unittest.TestCase):
+    """Test the main window's channel -> line index stays in sync with the lines"""
+    
+    def setUp(self):
+        self.app = _qt_app()
+        from PyQt5.QtWidgets import QMessageBox
+        from src.sip_engine import SIPEngine
+        from src.gui.main_window import MainWindow
+        self.QMessageBox = QMessageBox
+        self.engine = SIPEngine()
+        self.window = MainWindow(self.engine, None)
+    
+    def tearDown(self):
+        self.window.close()
+        self.window.deleteLater()
+    
+    def _pick(self, line_id, channel):
+        """Select a channel in a line's picker, as the operator would"""
+        picker = self.window.line_widgets[line_id - 1].channel_picker
+        picker.setCurrentIndex(picker.findData(channel))
+    
+    def _assert_index_in_sync(self):
+        expected = {}
+        for line_id in range(1, self.engine.num_lines + 1):
+            channel = self.engine.get_line(line_id).audio_output.channel
+            if channel:
+                expected[channel] = line_id
+        self.assertEqual(self.window._channel_owner, expected)
+    
+    def test_swap_and_cancel(self):
+        """Test the index through a plain assignment, a cancelled conflict and a confirmed swap"""
+        self._pick(1, 3)
+        self._pick(2, 5)
+        self._assert_index_in_sync()
+        self.assertEqual(self.window._channel_owner, {3: 1, 5: 2})
+        
+        # Line 2 asks for line 1's output - cancel keeps everything as it was
+        self._pick(2, 3)
+        self.window._conflict_msg.done(self.QMessageBox.Cancel)
+        self._assert_index_in_sync()
+        self.assertEqual(self.engine.get_line(2).audio_output.channel, 5)
+        self.assertEqual(self.window.line_widgets[1].channel_picker.currentData(), 5)
+        
+        # Confirm this time - line 1 drops to no output and line 2 takes channel 3
+        self._pick(2, 3)
+        self.window._conflict_msg.done(self.QMessageBox.Yes)
+        self._assert_index_in_sync()
+        self.assertEqual(self.window._channel_owner, {3: 2})
+        self.assertEqual(self.engine.get_line(1).audio_output.channel, 0)
+
+
+class TestNetworkParsing(unittest.TestCase):
+    """Test parsing of `ip route show default` and `resolvectl status` output"""
+    
+    ROUTES = (
+        "default via 10.0.0.1 dev wlan0 proto dhcp src 10.0.0.23 metric 600\n"
+        "default via 192.168.1.1 dev eth0 proto static metric 100\n"
+    )
+    
+    def setUp(self):
+        from src.gui.main_window import _ROUTE_RE, _DNS_RE
+        self.route_re = _ROUTE_RE
+        self.dns_re = _DNS_RE
+    
+    def test_route_single(self):
+        """Test gateway and proto from a single default route"""
+        match = self.route_re.search("default via 192.168.1.1 dev eth0 proto static metric 100\n")
+        self.assertEqual(match.groups(), ("192.168.1.1", "static"))
+    
+    def test_route_multiple(self):
+        """Test every default route is matched, so a later static one is found"""
+        matches = [m.groups() for m in self.route_re.finditer(self.ROUTES)]
+        self.assertEqual(matches, [("10.0.0.1", "dhcp"), ("192.168.1.1", "static")])
+    
+    def test_route_without_proto(self):
+        """Test a route without proto does not borrow the next line's proto"""
+        output = "default via 10.0.0.1 dev wlan0\nother via 10.0.0.2 proto static\n"
+        self.assertIsNone(self.route_re.search(output))
+    
+    def test_dns_server(self):
+        """Test the first listed DNS server is taken"""
+        output = ("Link 2 (eth0)\n"
+                  "    Current Scopes: DNS\n"
+                  "       DNS Servers: 8.8.8.8 1.1.1.1\n")
+        self.assertEqual(self.dns_re.search(output).group(1), "8.8.8.8")
+    
+    def test_dns_missing(self):
+        """Test no server is found when none is listed"""
+        self.assertIsNone(self.dns_re.search("Link 2 (eth0)\n    Current Scopes: none\n"))
+        # An empty entry must not pick up the next line
+        self.assertIsNone(self.dns_re.search("       DNS Servers:\n        DNS Domain: lan\n"))
+
+
+class TestSIPSettingsFile(unittest.TestCase):
+    """Test the SIP settings dialog's config load/save against a temp config file"""
+    
+    def setUp(self):
+        self.app = _qt_app()
+        from src.gui import sip_settings
+        self.sip_settings = sip_settings
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.tmp_dir, "sip_config.json")
+        with open(self.config_path, "w") as f:
+            json.dump({"sip_server": "sip.example.com", "sip_port": 5060, "transport": "UDP",
+                       "username": "user", "password": "secret",
+                       "caller_id_name": "Production Phone", "caller_id_number": ""}, f)
+        with mock.patch.object(sip_settings, "_CONFIG_PATH", self.config_path):
+            self.dialog = sip_settings.SIPSettingsDialog()
+        # Save shows a blocking confirmation box
+        patcher = mock.patch.object(sip_settings.QMessageBox, "information")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self.sip_settings._CONFIG_CACHE.pop(self.config_path, None)
+        self.dialog.deleteLater()
+        shutil.rmtree(self.tmp_dir)
+    
+    def _read(self):
+        with open(self.config_path) as f:
+            return json.load(f)
+    
+    def test_save_writes_json(self):
+        """Test a save replaces the file with valid JSON holding the field values"""
+        self.dialog.server_input.setText("sip.provider.net")
+        self.dialog.port_input.setText("5070")
+        self.dialog.save_settings()
+        config = self._read()
+        self.assertEqual(config["sip_server"], "sip.provider.net")
+        self.assertEqual(config["sip_port"], 5070)
+        self.assertFalse(os.path.exists(self.config_path + ".tmp"))
+    
+    def test_unchanged_save_skips_write(self):
+        """Test saving the same settings again leaves the file untouched"""
+        self.dialog.save_settings()
+        before = os.stat(self.config_path)
+        self.dialog.save_settings()
+        after = os.stat(self.config_path)
+        self.assertEqual((before.st_ino, before.st_mtime_ns), (after.st_ino, after.st_mtime_ns))
+    
+    def test_external_edit_invalidates_cache(self):
+        """Test a config file edited elsewhere (new mtime) is re-read"""
+        self.dialog.load_config()
+        config = self._read()
+        config["username"] = "edited"
+        with open(self.config_path, "w") as f:
+            json.dump(config, f)
+        # Make sure the mtime moves even on coarse-grained filesystems
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.dialog.load_config()
+        self.assertEqual(self.dialog.config["username"], "edited")
+    
+    def test_invalid_port_defaults(self):
+        """Test an out-of-range or non-numeric port is saved as 5060"""
+        for port in ("99999", "abc", ""):
+            self.dialog.port_input.setText("5070")
+            self.dialog.save_settings()
+            self.assertEqual(self._read()["sip_port"], 5070)
+            self.dialog.port_input.setText(port)
+            self.dialog.save_settings()
+            self.assertEqual(self._read()["sip_port"], 5060)
+
+
 class TestConfiguration(unittest.TestCase):
     """Test configuration file handling"""
     
@@ -169,6 +413,11 @@ def main():
     
     suite.addTests(loader.loadTestsFromTestCase(TestImports))
     suite.addTests(loader.loadTestsFromTestCase(TestPhoneLine))
+    suite.addTests(loader.loadTestsFromTestCase(TestSIPEngineLines))
+    suite.addTests(loader.loadTestsFromTestCase(TestNetworkDialog))
+    suite.addTests(loader.loadTestsFromTestCase(TestChannelOwnership))
+    suite.addTests(loader.loadTestsFromTestCase(TestNetworkParsing))
+    suite.addTests(loader.loadTestsFromTestCase(TestSIPSettingsFile))
     suite.addTests(loader.loadTestsFromTestCase(TestConfiguration))
     suite.addTests(loader.loadTestsFromTestCase(TestAudioSystem))
     